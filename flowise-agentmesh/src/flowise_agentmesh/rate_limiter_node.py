@@ -18,28 +18,38 @@ class RateLimitResult:
     retry_after: float | None = None
 
 
+_NS_PER_SECOND = 1_000_000_000
+
+
 @dataclass
 class _Bucket:
-    """Internal token bucket state."""
+    """Internal token bucket state.
+
+    Timestamps are integer nanoseconds so refill math subtracts ints.
+    """
 
     tokens: float
     max_tokens: float
-    last_refill: float
+    last_refill: int
     refill_rate: float  # tokens per second
 
-    def refill(self, now: float) -> None:
-        elapsed = now - self.last_refill
-        self.tokens = min(self.max_tokens, self.tokens + elapsed * self.refill_rate)
-        self.last_refill = now
+    def refill(self, now: int) -> None:
+        elapsed_ns = now - self.last_refill
+        if elapsed_ns:
+            self.tokens = min(
+                self.max_tokens,
+                self.tokens + elapsed_ns * self.refill_rate / _NS_PER_SECOND,
+            )
+            self.last_refill = now
 
-    def consume(self, now: float) -> bool:
+    def consume(self, now: int) -> bool:
         self.refill(now)
         if self.tokens >= 1.0:
             self.tokens -= 1.0
             return True
         return False
 
-    def time_until_available(self, now: float) -> float:
+    def time_until_available(self, now: int) -> float:
         self.refill(now)
         if self.tokens >= 1.0:
             return 0.0
@@ -67,7 +77,7 @@ class RateLimiterNode:
         self._refill_rate = max_requests / window_seconds
         self._buckets: dict[str, _Bucket] = {}
 
-    def _get_bucket(self, key: str, now: float) -> _Bucket:
+    def _get_bucket(self, key: str, now: int) -> _Bucket:
         if key not in self._buckets:
             self._buckets[key] = _Bucket(
                 tokens=float(self.max_requests),
@@ -83,8 +93,13 @@ class RateLimiterNode:
         action: str | None = None,
         now: float | None = None,
     ) -> RateLimitResult:
-        """Check and consume a token for the given agent/action pair."""
-        ts = now if now is not None else time.time()
+        """Check and consume a token for the given agent/action pair.
+
+        ``now`` is an optional wall-clock timestamp in seconds, as from
+        ``time.time()``; by default the current wall-clock time is used, so
+        explicit and default timestamps can share a bucket.
+        """
+        ts = int(now * _NS_PER_SECOND) if now is not None else time.time_ns()
         key = f"{agent_id or '*'}:{action or '*'}"
         bucket = self._get_bucket(key, ts)
 
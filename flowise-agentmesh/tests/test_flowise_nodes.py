@@ -3,6 +3,7 @@
 import json
 import os
 import tempfile
+import time
 
 import pytest
 
@@ -93,15 +94,19 @@ class TestLoadPolicy:
 
 # ── GovernanceNode tests ─────────────────────────────────────────────
 
+@pytest.fixture(scope="module")
+def search_only_node():
+    """Stateless governance node shared by read-only tests."""
+    return GovernanceNode(policy={"allowed_tools": ["search"]})
+
+
 class TestGovernanceNode:
-    def test_allowed_tool(self):
-        node = GovernanceNode(policy={"allowed_tools": ["search"]})
-        result = node.evaluate(tool_name="search")
+    def test_allowed_tool(self, search_only_node):
+        result = search_only_node.evaluate(tool_name="search")
         assert result.allowed
 
-    def test_blocked_tool(self):
-        node = GovernanceNode(policy={"allowed_tools": ["search"]})
-        result = node.evaluate(tool_name="delete")
+    def test_blocked_tool(self, search_only_node):
+        result = search_only_node.evaluate(tool_name="delete")
         assert not result.allowed
         assert "not allowed" in result.reason
 
@@ -129,64 +134,60 @@ class TestGovernanceNode:
         result = node.evaluate()
         assert result.allowed
 
-    def test_run_method_pass(self):
-        node = GovernanceNode(policy={"allowed_tools": ["search"]})
-        out = node.run({"tool": "search", "content": "hello"})
+    def test_run_method_pass(self, search_only_node):
+        out = search_only_node.run({"tool": "search", "content": "hello"})
         assert out["allowed"]
         assert out["output"] is not None
 
-    def test_run_method_block(self):
-        node = GovernanceNode(policy={"allowed_tools": ["search"]})
-        out = node.run({"tool": "delete"})
+    def test_run_method_block(self, search_only_node):
+        out = search_only_node.run({"tool": "delete"})
         assert not out["allowed"]
         assert out["output"] is None
 
 
 # ── TrustGateNode tests ──────────────────────────────────────────────
 
+@pytest.fixture(scope="module")
+def trust_gate():
+    """Stateless trust gate with the default 0.7 / 0.4 thresholds."""
+    return TrustGateNode(min_trust_score=0.7, review_threshold=0.4)
+
+
 class TestTrustGateNode:
-    def test_trusted_tier(self):
-        gate = TrustGateNode(min_trust_score=0.7, review_threshold=0.4)
-        result = gate.evaluate("agent-1", 0.9)
+    def test_trusted_tier(self, trust_gate):
+        result = trust_gate.evaluate("agent-1", 0.9)
         assert result.tier == "trusted"
 
-    def test_review_tier(self):
-        gate = TrustGateNode(min_trust_score=0.7, review_threshold=0.4)
-        result = gate.evaluate("agent-2", 0.5)
+    def test_review_tier(self, trust_gate):
+        result = trust_gate.evaluate("agent-2", 0.5)
         assert result.tier == "review"
 
-    def test_blocked_tier(self):
-        gate = TrustGateNode(min_trust_score=0.7, review_threshold=0.4)
-        result = gate.evaluate("agent-3", 0.2)
+    def test_blocked_tier(self, trust_gate):
+        result = trust_gate.evaluate("agent-3", 0.2)
         assert result.tier == "blocked"
 
-    def test_boundary_trusted(self):
-        gate = TrustGateNode(min_trust_score=0.7, review_threshold=0.4)
-        result = gate.evaluate("agent-4", 0.7)
+    def test_boundary_trusted(self, trust_gate):
+        result = trust_gate.evaluate("agent-4", 0.7)
         assert result.tier == "trusted"
 
-    def test_boundary_review(self):
-        gate = TrustGateNode(min_trust_score=0.7, review_threshold=0.4)
-        result = gate.evaluate("agent-5", 0.4)
+    def test_boundary_review(self, trust_gate):
+        result = trust_gate.evaluate("agent-5", 0.4)
         assert result.tier == "review"
 
-    def test_score_clamping_high(self):
-        gate = TrustGateNode()
-        result = gate.evaluate("agent-6", 1.5)
+    def test_score_clamping_high(self, trust_gate):
+        result = trust_gate.evaluate("agent-6", 1.5)
         assert result.trust_score == 1.0
 
-    def test_score_clamping_low(self):
-        gate = TrustGateNode()
-        result = gate.evaluate("agent-7", -0.5)
+    def test_score_clamping_low(self, trust_gate):
+        result = trust_gate.evaluate("agent-7", -0.5)
         assert result.trust_score == 0.0
 
     def test_invalid_thresholds(self):
         with pytest.raises(ValueError):
             TrustGateNode(min_trust_score=0.3, review_threshold=0.8)
 
-    def test_run_method(self):
-        gate = TrustGateNode()
-        out = gate.run({"agent_id": "a1", "trust_score": 0.9})
+    def test_run_method(self, trust_gate):
+        out = trust_gate.run({"agent_id": "a1", "trust_score": 0.9})
         assert out["tier"] == "trusted"
         assert out["output"] is not None
 
@@ -319,6 +320,13 @@ class TestRateLimiterNode:
         result = limiter.check(agent_id="a1", now=111.0)
         assert result.allowed
 
+    def test_explicit_and_default_timestamps_share_a_clock(self):
+        limiter = RateLimiterNode(max_requests=1, window_seconds=10)
+        assert limiter.check(agent_id="a1", now=time.time() - 11).allowed
+        # A full window has passed on the wall clock, so the bucket refilled
+        assert limiter.check(agent_id="a1").allowed
+        assert not limiter.check(agent_id="a1", now=time.time()).allowed
+
     def test_per_agent_isolation(self):
         limiter = RateLimiterNode(max_requests=1, window_seconds=60)
         limiter.check(agent_id="a1", now=100.0)
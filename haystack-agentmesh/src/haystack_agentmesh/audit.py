@@ -7,10 +7,18 @@ from __future__ import annotations
 
 import hashlib
 import json
+import struct
+import sys
+import threading
 import time
 import uuid
-from dataclasses import asdict, dataclass, field
-from typing import Any, Dict, List, Optional
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
 
 try:
     from haystack import component
@@ -33,10 +41,24 @@ except ImportError:  # pragma: no cover
 
     component = _ComponentShim()  # type: ignore[assignment]
 
+# Version of the canonical encoding that ``chain_hash`` is computed over.
+# 1: fields joined with "|" (entries exported before length-prefixing).
+# 2: length-prefixed binary fields, see :func:`_canonical_bytes`.
+HASH_VERSION = 2
+_LEGACY_HASH_VERSION = 1
+
+# ``slots=True`` drops the per-instance ``__dict__`` (Python 3.10+).
+_DATACLASS_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
-@dataclass
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class AuditEntry:
-    """A single immutable audit record."""
+    """A single immutable audit record.
+
+    ``hash_version`` names the encoding ``chain_hash`` was computed over.
+    It defaults to the legacy format so records loaded from exports that
+    predate the field still verify.
+    """
 
     entry_id: str
     timestamp: float
@@ -46,16 +68,116 @@ class AuditEntry:
     metadata: Dict[str, Any] = field(default_factory=dict)
     prev_hash: str = ""
     chain_hash: str = ""
+    hash_version: int = _LEGACY_HASH_VERSION
 
 
-def _hash_entry(entry: AuditEntry) -> str:
-    """Compute SHA-256 hash chaining this entry to the previous one."""
+def entry_to_dict(entry: AuditEntry) -> Dict[str, Any]:
+    """Return *entry* as a flat dict of JSON-ready values.
+
+    Cheaper than ``dataclasses.asdict``, which deep-copies ``metadata``.
+    """
+    return {
+        "entry_id": entry.entry_id,
+        "timestamp": entry.timestamp,
+        "action": entry.action,
+        "agent_id": entry.agent_id,
+        "decision": entry.decision,
+        "metadata": entry.metadata,
+        "prev_hash": entry.prev_hash,
+        "chain_hash": entry.chain_hash,
+        "hash_version": entry.hash_version,
+    }
+
+
+def _dumps_line(record: Dict[str, Any]) -> str:
+    """Serialize one JSONL record, using orjson when it is installed.
+
+    The json fallback uses orjson's compact separators and raw UTF-8 so
+    both paths write the same line.  They still differ on non-finite
+    floats and on exponent formatting (``1e-7`` vs ``1e-07``).
+    """
+    if orjson is not None:
+        return orjson.dumps(record, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(record, default=str, separators=(",", ":"), ensure_ascii=False)
+
+
+# hashlib is backed by OpenSSL, which already dispatches to the SHA-NI /
+# ARMv8 SHA instructions when the CPU has them.
+_sha256 = hashlib.sha256
+
+
+# Canonical layout: big-endian float64 timestamp, then each text field as
+# a uint32 byte length followed by its UTF-8 bytes.  Length prefixes make
+# the encoding unambiguous even when fields contain separator characters.
+_TIMESTAMP = struct.Struct(">d")
+_LENGTH = struct.Struct(">I")
+_EMPTY_METADATA = b"{}"
+
+
+def _field(value: str) -> bytes:
+    raw = value.encode("utf-8")
+    return _LENGTH.pack(len(raw)) + raw
+
+
+def _canonical_bytes(entry: AuditEntry) -> bytes:
+    """Return the canonical byte encoding of *entry* that gets hashed."""
+    metadata = entry.metadata
+    if metadata:
+        raw_metadata = json.dumps(metadata, sort_keys=True).encode("utf-8")
+    else:
+        raw_metadata = _EMPTY_METADATA
+    return b"".join((
+        _TIMESTAMP.pack(entry.timestamp),
+        _field(entry.entry_id),
+        _field(entry.action),
+        _field(entry.agent_id),
+        _field(entry.decision),
+        _LENGTH.pack(len(raw_metadata)),
+        raw_metadata,
+        _field(entry.prev_hash),
+    ))
+
+
+def _legacy_canonical_bytes(entry: AuditEntry) -> bytes:
+    """Return the version 1 encoding of *entry*, kept for old exports."""
     payload = (
         f"{entry.entry_id}|{entry.timestamp}|{entry.action}|"
         f"{entry.agent_id}|{entry.decision}|"
         f"{json.dumps(entry.metadata, sort_keys=True)}|{entry.prev_hash}"
     )
-    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    return payload.encode("utf-8")
+
+
+_ENCODERS = {
+    _LEGACY_HASH_VERSION: _legacy_canonical_bytes,
+    HASH_VERSION: _canonical_bytes,
+}
+
+
+def _hash_entry(entry: AuditEntry) -> str:
+    """Compute SHA-256 hash chaining this entry to the previous one.
+
+    Always re-derived from the entry's current fields so that
+    :meth:`AuditLogger.verify_chain` detects in-place tampering.
+    """
+    return _sha256(_ENCODERS[entry.hash_version](entry)).hexdigest()
+
+
+def verify_entries(entries: Iterable[AuditEntry]) -> bool:
+    """Verify a hash chain of *entries*, e.g. records loaded from a JSONL export.
+
+    Each entry is checked against the encoding named by its
+    ``hash_version``; an unknown version fails verification.
+    """
+    entries = list(entries)
+    # Each digest depends only on the entry's *stored* prev_hash, so the
+    # cheap link check runs first and broken links fail before hashing.
+    prev = "genesis"
+    for entry in entries:
+        if entry.prev_hash != prev or entry.hash_version not in _ENCODERS:
+            return False
+        prev = entry.chain_hash
+    return all(_hash_entry(entry) == entry.chain_hash for entry in entries)
 
 
 @component
@@ -63,12 +185,27 @@ class AuditLogger:
     """Append-only audit logger with SHA-256 hash chain integrity.
 
     Each entry is chained to the previous entry's hash, making the
-    log tamper-evident.  Supports JSONL export for offline analysis.
+    log tamper-evident.  Appending is O(1): an entry's digest covers only
+    its own fields plus the stored digest of its predecessor.  Supports
+    JSONL export for offline analysis.
     """
 
     def __init__(self) -> None:
         self._entries: List[AuditEntry] = []
+        # JSONL line for each entry, serialized once when it is recorded.
+        self._lines: List[str] = []
         self._last_hash: str = "genesis"
+        # Entry ids are a per-logger random prefix plus a monotonic
+        # counter, avoiding an os.urandom() call per entry.
+        self._id_prefix: str = uuid.uuid4().hex[:8]
+        self._counter: int = 0
+        # Serialises appends so the hash chain and id counter stay
+        # consistent when one logger is shared across threads.
+        self._lock = threading.Lock()
+        # Read-only snapshot of ``_entries``; rebuilt only after appends.
+        self._entries_version: int = 0
+        self._cached_version: int = -1
+        self._cached_entries: Tuple[AuditEntry, ...] = ()
 
     # ── Component interface ───────────────────────────────────────
 
@@ -87,26 +224,43 @@ class AuditLogger:
         metadata: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Any]:
         """Record an audit entry and return ``entry_id`` and ``chain_hash``."""
-        entry = AuditEntry(
-            entry_id=uuid.uuid4().hex[:16],
-            timestamp=time.time(),
-            action=action,
-            agent_id=agent_id,
-            decision=decision,
-            metadata=metadata or {},
-            prev_hash=self._last_hash,
-        )
-        entry.chain_hash = _hash_entry(entry)
-        self._last_hash = entry.chain_hash
-        self._entries.append(entry)
+        with self._lock:
+            counter = self._counter + 1
+            entry = AuditEntry(
+                entry_id=f"{self._id_prefix}{counter:08x}",
+                timestamp=time.time(),
+                action=action,
+                agent_id=agent_id,
+                decision=decision,
+                metadata=metadata or {},
+                prev_hash=self._last_hash,
+                hash_version=HASH_VERSION,
+            )
+            # The digest covers every other field, so it is filled in last.
+            object.__setattr__(entry, "chain_hash", _hash_entry(entry))
+            # Hash and serialize before touching any state, so an entry that
+            # cannot be encoded leaves the chain and the export in step.
+            line = _dumps_line(entry_to_dict(entry))
+            self._counter = counter
+            self._last_hash = entry.chain_hash
+            self._entries.append(entry)
+            self._lines.append(line)
+            self._entries_version += 1
         return {"entry_id": entry.entry_id, "chain_hash": entry.chain_hash}
 
     # ── Query helpers ─────────────────────────────────────────────
 
     @property
-    def entries(self) -> List[AuditEntry]:
-        """Return a copy of all audit entries."""
-        return list(self._entries)
+    def entries(self) -> Tuple[AuditEntry, ...]:
+        """Return a read-only snapshot of all audit entries.
+
+        The tuple is cached and only rebuilt after new entries are
+        appended, so repeated reads are O(1).
+        """
+        if self._cached_version != self._entries_version:
+            self._cached_entries = tuple(self._entries)
+            self._cached_version = self._entries_version
+        return self._cached_entries
 
     def verify_chain(self) -> bool:
         """Verify the integrity of the full hash chain.
@@ -114,23 +268,19 @@ class AuditLogger:
         Returns ``True`` if every entry's ``chain_hash`` matches its
         recomputed value and the ``prev_hash`` links are consistent.
         """
-        prev = "genesis"
-        for entry in self._entries:
-            if entry.prev_hash != prev:
-                return False
-            if _hash_entry(entry) != entry.chain_hash:
-                return False
-            prev = entry.chain_hash
-        return True
+        return verify_entries(self._entries)
 
     def export_jsonl(self, path: str) -> int:
         """Export audit entries to a JSONL file. Returns entry count."""
-        with open(path, "w") as fh:
-            for entry in self._entries:
-                fh.write(json.dumps(asdict(entry), default=str) + "\n")
+        # Lines are serialized at record time, so export is pure I/O; stream
+        # them through the file buffer rather than joining one big string.
+        with open(path, "w", encoding="utf-8") as fh:
+            for line in self._lines:
+                fh.write(line)
+                fh.write("\n")
         return len(self._entries)
 
     def to_jsonl_string(self) -> str:
         """Serialize all entries to a JSONL string."""
-        lines = [json.dumps(asdict(e), default=str) for e in self._entries]
+        lines = self._lines
         return "\n".join(lines) + ("\n" if lines else "")
@@ -9,10 +9,16 @@ from __future__ import annotations
 import fnmatch
 import re
 import time
-from typing import Any, Dict, List, Optional, Tuple
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
 
 import yaml
 
+try:
+    import ahocorasick
+except ImportError:  # pragma: no cover
+    ahocorasick = None  # type: ignore[assignment]
+
 try:
     from haystack import component
 except ImportError:  # pragma: no cover
@@ -36,6 +42,25 @@ except ImportError:  # pragma: no cover
     component = _ComponentShim()  # type: ignore[assignment]
 
 
+def _combine_patterns(
+    patterns: List[Tuple[str, str, "re.Pattern[str]"]],
+) -> Optional["re.Pattern[str]"]:
+    """Union compiled patterns into one alternation regex.
+
+    Patterns with capture groups are left unfused, since joining them
+    would renumber any backreferences.
+    """
+    if any(compiled.groups for _, _, compiled in patterns):
+        return None
+    try:
+        return re.compile(
+            "|".join(f"(?:{c.pattern})" for _, _, c in patterns),
+            re.IGNORECASE,
+        )
+    except re.error:
+        return None
+
+
 @component
 class GovernancePolicyChecker:
     """Checks agent actions against a governance policy loaded from YAML.
@@ -51,7 +76,10 @@ class GovernancePolicyChecker:
     ) -> None:
         self._policy: Dict[str, Any] = {}
         self._compiled_patterns: List[Tuple[str, str, "re.Pattern[str]"]] = []
-        self._rate_tracker: Dict[str, List[float]] = {}
+        self._substring_automaton: Any = None
+        self._combined_pattern: Optional["re.Pattern[str]"] = None
+        self._prescreen_ready = False
+        self._rate_tracker: Dict[str, Deque[int]] = {}
 
         if policy_path is not None:
             self.load_policy_file(policy_path)
@@ -82,6 +110,58 @@ class GovernancePolicyChecker:
             else:
                 compiled = re.compile(re.escape(pattern), re.IGNORECASE)
             self._compiled_patterns.append((pattern, ptype, compiled))
+        self._build_prescreen()
+
+    def _build_prescreen(self) -> None:
+        """Prepare a single-pass screen that rejects clean text early.
+
+        ASCII substring patterns go into an Aho-Corasick automaton when
+        ``pyahocorasick`` is installed; everything else is unioned into
+        one alternation regex.  The automaton only stands in for
+        ``re.IGNORECASE`` on ASCII text, so non-ASCII text always falls
+        through to the per-pattern loop, which stays authoritative for
+        reporting which pattern matched.
+        """
+        self._substring_automaton = None
+        self._combined_pattern = None
+        self._prescreen_ready = False
+        patterns = self._compiled_patterns
+        if len(patterns) < 2:
+            return
+
+        rest = patterns
+        if ahocorasick is not None:
+            # For ASCII pattern and text, lower() plus an exact match is
+            # equivalent to re.IGNORECASE; non-ASCII literals stay regexes.
+            literals = [
+                p for p in patterns
+                if p[1] not in ("regex", "glob") and p[0] and p[0].isascii()
+            ]
+            if literals:
+                automaton = ahocorasick.Automaton()
+                for literal, _, _ in literals:
+                    automaton.add_word(literal.lower(), literal)
+                automaton.make_automaton()
+                self._substring_automaton = automaton
+                rest = [p for p in patterns if p not in literals]
+
+        if rest:
+            self._combined_pattern = _combine_patterns(rest)
+            if self._combined_pattern is None:
+                self._substring_automaton = None
+                return
+        self._prescreen_ready = True
+
+    def _may_match(self, text: str) -> bool:
+        """Return ``False`` only if no blocked pattern can match *text*."""
+        automaton = self._substring_automaton
+        if automaton is not None:
+            if not text.isascii():
+                return True
+            for _ in automaton.iter(text.lower()):
+                return True
+        combined = self._combined_pattern
+        return combined is not None and combined.search(text) is not None
 
     # ── Component interface ───────────────────────────────────────
 
@@ -149,6 +229,9 @@ class GovernancePolicyChecker:
 
     def _check_content(self, action: str, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         text = f"{action} {' '.join(str(v) for v in params.values())}"
+        if self._prescreen_ready and not self._may_match(text):
+            return None
+        # Report the first matching pattern in policy order.
         for pattern, ptype, compiled in self._compiled_patterns:
             if compiled.search(text):
                 return {
@@ -181,14 +264,20 @@ class GovernancePolicyChecker:
         if max_calls <= 0:
             return None
 
-        now = time.time()
-        calls = self._rate_tracker.setdefault(agent_id, [])
-        # Prune expired entries
-        calls[:] = [t for t in calls if now - t < window_seconds]
-        if len(calls) >= max_calls:
+        # Integer nanoseconds on the monotonic clock: immune to wall-clock
+        # jumps and keeps the window comparison in int arithmetic.
+        now = time.monotonic_ns()
+        window_ns = int(window_seconds * 1_000_000_000)
+        # Only the last ``max_calls`` accepted calls matter: the window is
+        # full exactly when the oldest of them is still inside it.
+        calls = self._rate_tracker.get(agent_id)
+        if calls is None or calls.maxlen != max_calls:
+            calls = deque(calls or (), maxlen=max_calls)
+            self._rate_tracker[agent_id] = calls
+        if len(calls) == max_calls and now - calls[0] < window_ns:
             return {
                 "decision": "audit",
-                "reason": f"Rate limit: {len(calls)}/{max_calls} calls in {window_seconds}s window",
+                "reason": f"Rate limit: {max_calls}/{max_calls} calls in {window_seconds}s window",
                 "passed": False,
             }
         calls.append(now)
@@ -6,6 +6,8 @@ decisions (pass / review / block).
 
 from __future__ import annotations
 
+import bisect
+import sys
 import time
 from dataclasses import dataclass, field
 from typing import Any, Dict, Optional
@@ -31,15 +33,24 @@ except ImportError:  # pragma: no cover
 
     component = _ComponentShim()  # type: ignore[assignment]
 
+# (action, trusted) for scores below review / below pass / at or above pass.
+_TIERS = (("block", False), ("review", False), ("pass", True))
 
-@dataclass
+# Converts a nanosecond interval to hours without a division per call.
+_HOURS_PER_NS = 1.0 / 3_600_000_000_000
+
+# ``slots=True`` drops the per-instance ``__dict__`` (Python 3.10+).
+_DATACLASS_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class AgentTrustRecord:
     """Internal trust state for a single agent."""
 
     score: float = 0.5
     successes: int = 0
     failures: int = 0
-    last_update: float = field(default_factory=time.time)
+    last_update: int = field(default_factory=time.monotonic_ns)
 
 
 @component
@@ -77,26 +88,40 @@ class TrustGate:
         """Record a successful action and return the updated score."""
         rec = self._get_record(agent_id)
         rec.successes += 1
-        rec.score = min(rec.score + self.reward, 1.0)
-        rec.last_update = time.time()
+        score = rec.score + self.reward
+        rec.score = score if score < 1.0 else 1.0
+        rec.last_update = time.monotonic_ns()
         return rec.score
 
     def record_failure(self, agent_id: str) -> float:
         """Record a failed action and return the updated score."""
         rec = self._get_record(agent_id)
         rec.failures += 1
-        rec.score = max(rec.score - self.penalty, 0.0)
-        rec.last_update = time.time()
+        score = rec.score - self.penalty
+        rec.score = score if score > 0.0 else 0.0
+        rec.last_update = time.monotonic_ns()
         return rec.score
 
     def apply_decay(self, agent_id: str) -> float:
         """Apply time-based decay to an agent's trust score."""
         rec = self._get_record(agent_id)
-        elapsed_hours = (time.time() - rec.last_update) / 3600.0
-        decay = self.decay_rate * elapsed_hours
-        rec.score = max(rec.score - decay, 0.0)
+        elapsed_hours = (time.monotonic_ns() - rec.last_update) * _HOURS_PER_NS
+        score = rec.score - self.decay_rate * elapsed_hours
+        rec.score = score if score > 0.0 else 0.0
         return rec.score
 
+    def apply_decay_all(self) -> None:
+        """Apply time-based decay to every tracked agent in one pass.
+
+        Equivalent to calling :meth:`apply_decay` for each agent, but
+        reads the clock once and keeps the loop state in locals.
+        """
+        now = time.monotonic_ns()
+        per_ns = self.decay_rate * _HOURS_PER_NS
+        for rec in self._records.values():
+            score = rec.score - per_ns * (now - rec.last_update)
+            rec.score = score if score > 0.0 else 0.0
+
     def get_score(self, agent_id: str) -> float:
         """Return the current trust score for *agent_id*."""
         return self._get_record(agent_id).score
@@ -119,14 +144,8 @@ class TrustGate:
         score = self.get_score(agent_id)
         threshold = min_score if min_score is not None else self.pass_threshold
 
-        if score >= threshold:
-            action = "pass"
-            trusted = True
-        elif score >= self.review_threshold:
-            action = "review"
-            trusted = False
-        else:
-            action = "block"
-            trusted = False
+        # An override below review_threshold collapses the review band.
+        bounds = (min(self.review_threshold, threshold), threshold)
+        action, trusted = _TIERS[bisect.bisect_right(bounds, score)]
 
         return {"trusted": trusted, "score": round(score, 4), "action": action}
@@ -1,12 +1,47 @@
 """Tests for AuditLogger component."""
 
+import hashlib
 import json
 import os
 import tempfile
+import threading
+from dataclasses import FrozenInstanceError, asdict
 
 import pytest
 
-from haystack_agentmesh.audit import AuditLogger, _hash_entry
+from haystack_agentmesh import audit
+from haystack_agentmesh.audit import (
+    HASH_VERSION,
+    AuditEntry,
+    AuditLogger,
+    _hash_entry,
+    entry_to_dict,
+    verify_entries,
+)
+
+
+def _legacy_records(count):
+    """Build JSONL records as exported before ``hash_version`` existed."""
+    records = []
+    prev = "genesis"
+    for i in range(count):
+        record = {
+            "entry_id": f"legacy{i:010x}",
+            "timestamp": 1700000000.25 + i,
+            "action": f"action-{i}",
+            "agent_id": "a1",
+            "decision": "allow",
+            "metadata": {"n": i},
+            "prev_hash": prev,
+        }
+        payload = (
+            f"{record['entry_id']}|{record['timestamp']}|{record['action']}|"
+            f"{record['agent_id']}|{record['decision']}|"
+            f"{json.dumps(record['metadata'], sort_keys=True)}|{prev}"
+        )
+        prev = record["chain_hash"] = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+        records.append(record)
+    return records
 
 
 class TestAuditLogger:
@@ -34,8 +69,8 @@ class TestAuditLogger:
         logger = AuditLogger()
         logger.run(action="a", agent_id="a1", decision="allow")
         logger.run(action="b", agent_id="a1", decision="deny")
-        # Tamper with first entry
-        logger._entries[0].action = "tampered"
+        # Tamper with first entry (entries are frozen, so bypass that)
+        object.__setattr__(logger._entries[0], "action", "tampered")
         assert logger.verify_chain() is False
 
     def test_prev_hash_links(self):
@@ -84,3 +119,114 @@ class TestAuditLogger:
         r1 = logger.run(action="x", agent_id="a1", decision="allow")
         entry = logger.entries[0]
         assert _hash_entry(entry) == r1["chain_hash"]
+
+    def test_entries_snapshot_is_read_only(self):
+        logger = AuditLogger()
+        logger.run(action="a", agent_id="a1", decision="allow")
+        snapshot = logger.entries
+        assert isinstance(snapshot, tuple)
+        assert logger.entries is snapshot
+        logger.run(action="b", agent_id="a1", decision="allow")
+        assert len(snapshot) == 1
+        assert len(logger.entries) == 2
+
+    def test_entry_ids_unique_and_fixed_width(self):
+        logger = AuditLogger()
+        ids = [logger.run(action="a", agent_id="a1", decision="allow")["entry_id"] for _ in range(3)]
+        assert len(set(ids)) == 3
+        assert all(len(i) == 16 for i in ids)
+
+    def test_entries_are_frozen(self):
+        logger = AuditLogger()
+        logger.run(action="a", agent_id="a1", decision="allow")
+        with pytest.raises(FrozenInstanceError):
+            logger.entries[0].action = "tampered"
+
+    def test_entry_to_dict_matches_asdict(self):
+        logger = AuditLogger()
+        logger.run(action="a", agent_id="a1", decision="allow", metadata={"k": 1})
+        entry = logger.entries[0]
+        assert entry_to_dict(entry) == asdict(entry)
+
+    def test_field_boundaries_are_unambiguous(self):
+        logger = AuditLogger()
+        logger.run(action="a|b", agent_id="c", decision="allow")
+        logger.run(action="a", agent_id="b|c", decision="allow")
+        first, second = logger.entries
+        object.__setattr__(second, "entry_id", first.entry_id)
+        object.__setattr__(second, "timestamp", first.timestamp)
+        object.__setattr__(second, "prev_hash", first.prev_hash)
+        assert _hash_entry(first) != _hash_entry(second)
+
+    def test_concurrent_runs_keep_chain_valid(self):
+        logger = AuditLogger()
+
+        def worker(n):
+            for i in range(50):
+                logger.run(action=f"a{i}", agent_id=f"agent-{n}", decision="allow")
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert len(logger.entries) == 200
+        assert len({e.entry_id for e in logger.entries}) == 200
+        assert logger.verify_chain() is True
+
+    def test_exported_chain_verifies_after_reload(self):
+        logger = AuditLogger()
+        logger.run(action="a", agent_id="a1", decision="allow", metadata={"k": 1})
+        logger.run(action="b", agent_id="a2", decision="deny")
+        records = [json.loads(line) for line in logger.to_jsonl_string().splitlines()]
+        assert all(r["hash_version"] == HASH_VERSION for r in records)
+        assert verify_entries(AuditEntry(**r) for r in records) is True
+
+    def test_legacy_export_still_verifies(self):
+        entries = [AuditEntry(**r) for r in _legacy_records(3)]
+        assert verify_entries(entries) is True
+
+        object.__setattr__(entries[1], "decision", "deny")
+        assert verify_entries(entries) is False
+
+    def test_unknown_hash_version_fails_verification(self):
+        logger = AuditLogger()
+        logger.run(action="a", agent_id="a1", decision="allow")
+        object.__setattr__(logger._entries[0], "hash_version", 99)
+        assert logger.verify_chain() is False
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_jsonl_lines_match_without_orjson(self, monkeypatch, use_orjson):
+        if use_orjson:
+            pytest.importorskip("orjson")
+        else:
+            monkeypatch.setattr(audit, "orjson", None)
+        record = {
+            "entry_id": "abc",
+            "timestamp": 1760000000.123456,
+            "action": "caf\u00e9 \u2603",
+            "metadata": {1: [True, None], "nested": {"k": 2.5}, "obj": object},
+        }
+        expected = (
+            '{"entry_id":"abc","timestamp":1760000000.123456,'
+            '"action":"caf\u00e9 \u2603","metadata":{"1":[true,null],'
+            '"nested":{"k":2.5},"obj":"<class \'object\'>"}}'
+        )
+        assert audit._dumps_line(record) == expected
+
+    def test_failed_serialization_leaves_chain_unchanged(self, monkeypatch):
+        logger = AuditLogger()
+        logger.run(action="a", agent_id="a1", decision="allow")
+
+        def fail(record):
+            raise TypeError("unserializable")
+
+        monkeypatch.setattr(audit, "_dumps_line", fail)
+        with pytest.raises(TypeError):
+            logger.run(action="b", agent_id="a1", decision="allow")
+        monkeypatch.undo()
+
+        logger.run(action="c", agent_id="a1", decision="allow")
+        assert [e.action for e in logger.entries] == ["a", "c"]
+        assert len(logger.to_jsonl_string().splitlines()) == 2
+        assert logger.verify_chain() is True
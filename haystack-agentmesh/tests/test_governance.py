@@ -1,11 +1,13 @@
 """Tests for GovernancePolicyChecker component."""
 
 import os
+import re
 import tempfile
 
 import pytest
 import yaml
 
+from haystack_agentmesh import governance
 from haystack_agentmesh.governance import GovernancePolicyChecker
 
 
@@ -110,3 +112,53 @@ class TestGovernancePolicyChecker:
         checker = GovernancePolicyChecker(policy_dict=policy)
         result = checker.run(action="search", params={"file": "malware.exe"})
         assert result["decision"] == "deny"
+
+    def test_first_matching_pattern_reported(self):
+        policy = {
+            "blocked_patterns": [
+                {"pattern": "secret", "type": "substring"},
+                {"pattern": "*.exe", "type": "glob"},
+                {"pattern": r"pass(?:word)?", "type": "regex"},
+            ],
+        }
+        checker = GovernancePolicyChecker(policy_dict=policy)
+        result = checker.run(action="search", params={"file": "secret.exe"})
+        assert result["decision"] == "deny"
+        assert "'secret'" in result["reason"]
+        assert checker.run(action="search", params={"q": "hello"})["decision"] == "allow"
+
+    @pytest.mark.parametrize("use_automaton", [True, False])
+    def test_prescreen_matches_per_pattern_search(self, monkeypatch, use_automaton):
+        if not use_automaton:
+            monkeypatch.setattr("haystack_agentmesh.governance.ahocorasick", None)
+        elif governance.ahocorasick is None:
+            pytest.skip("pyahocorasick not installed")
+        patterns = [
+            {"pattern": "FILE", "type": "substring"},
+            {"pattern": "Stra\u00dfe", "type": "substring"},
+            {"pattern": "*.exe", "type": "glob"},
+        ]
+        single = GovernancePolicyChecker(policy_dict={"blocked_patterns": patterns[:1]})
+        multi = GovernancePolicyChecker(policy_dict={"blocked_patterns": patterns})
+        assert multi._prescreen_ready
+        assert (multi._substring_automaton is not None) is use_automaton
+        for text in ["rm file", "rm f\u0131le", "STRASSE", "stra\u00dfe", "a.exe", "hello"]:
+            expected = any(
+                re.search(c.pattern, text, re.IGNORECASE) for _, _, c in multi._compiled_patterns
+            )
+            assert (multi.run(action="search", params={"q": text})["decision"] == "deny") is expected
+        # Dotless i matches I under re.IGNORECASE; both policies must agree
+        assert single.run(action="search", params={"q": "f\u0131le"})["decision"] == "deny"
+        assert multi.run(action="search", params={"q": "f\u0131le"})["decision"] == "deny"
+
+    def test_rate_limit_window_expires(self):
+        policy = {"rate_limit": {"max_calls": 2, "window_seconds": 60}}
+        checker = GovernancePolicyChecker(policy_dict=policy)
+        for _ in range(2):
+            checker.run(action="search", agent_id="agent-1")
+        assert checker.run(action="search", agent_id="agent-1")["decision"] == "audit"
+        # Age the recorded calls past the window
+        calls = checker._rate_tracker["agent-1"]
+        for i in range(len(calls)):
+            calls[i] -= 61 * 1_000_000_000
+        assert checker.run(action="search", agent_id="agent-1")["decision"] == "allow"
@@ -1,5 +1,6 @@
 """Tests for TrustGate component."""
 
+import sys
 import time
 
 import pytest
@@ -62,7 +63,7 @@ class TestTrustGate:
     def test_decay_reduces_score(self):
         gate = TrustGate(decay_rate=0.5)
         rec = gate._get_record("a")
-        rec.last_update = time.time() - 7200  # 2 hours ago
+        rec.last_update = time.monotonic_ns() - 7200 * 10**9  # 2 hours ago
         gate.apply_decay("a")
         assert gate.get_score("a") < 0.5
 
@@ -78,3 +79,15 @@ class TestTrustGate:
         gate.record_success("x")
         gate.record_failure("y")
         assert gate.get_score("x") > gate.get_score("y")
+
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need 3.10+")
+    def test_record_has_no_instance_dict(self):
+        assert not hasattr(AgentTrustRecord(), "__dict__")
+
+    def test_apply_decay_all(self):
+        gate = TrustGate(decay_rate=0.5)
+        for agent_id in ("a", "b"):
+            gate._get_record(agent_id).last_update = time.monotonic_ns() - 7200 * 10**9
+        gate.apply_decay_all()
+        assert gate.get_score("a") < 0.5
+        assert gate.get_score("b") < 0.5
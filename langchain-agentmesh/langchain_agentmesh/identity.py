@@ -11,7 +11,7 @@ import hashlib
 import time
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 # Try to import cryptography for real Ed25519 operations
 try:
@@ -22,6 +22,18 @@ try:
 except ImportError:
     CRYPTO_AVAILABLE = False
 
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def _deadline_ns(
+    expires_at: datetime, cached: Optional[Tuple[datetime, int]]
+) -> Tuple[datetime, int]:
+    """Return ``(expires_at, epoch_ns)``, reusing *cached* if still current."""
+    if cached is None or cached[0] is not expires_at:
+        cached = (expires_at, (expires_at - _EPOCH) // _MICROSECOND * 1000)
+    return cached
+
 
 @dataclass
 class VerificationSignature:
@@ -73,6 +85,44 @@ class VerificationIdentity:
     capabilities: List[str] = field(default_factory=list)
     created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
     expires_at: Optional[datetime] = None  # Identity expiration for TTL enforcement
+    # Parsed key objects, keyed by the base64 string they were built from
+    _private_key_cache: Optional[Tuple[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _public_key_cache: Optional[Tuple[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _expires_ns: Optional[Tuple[datetime, int]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Parsed key objects cannot be pickled or deep-copied; drop them
+        # and let the copy re-parse the base64 keys on first use.
+        state = self.__dict__.copy()
+        state["_private_key_cache"] = None
+        state["_public_key_cache"] = None
+        return state
+
+    def _private_key_object(self) -> "ed25519.Ed25519PrivateKey":
+        """Return the parsed private key, decoding it on first use."""
+        cached = self._private_key_cache
+        if cached is None or cached[0] != self.private_key:
+            key_obj = ed25519.Ed25519PrivateKey.from_private_bytes(
+                base64.b64decode(self.private_key)
+            )
+            cached = self._private_key_cache = (self.private_key, key_obj)
+        return cached[1]
+
+    def _public_key_object(self) -> "ed25519.Ed25519PublicKey":
+        """Return the parsed public key, decoding it on first use."""
+        cached = self._public_key_cache
+        if cached is None or cached[0] != self.public_key:
+            key_obj = ed25519.Ed25519PublicKey.from_public_bytes(
+                base64.b64decode(self.public_key)
+            )
+            cached = self._public_key_cache = (self.public_key, key_obj)
+        return cached[1]
 
     def is_expired(self) -> bool:
         """Check if this identity has expired.
@@ -80,9 +130,11 @@ class VerificationIdentity:
         Returns:
             True if expired, False if still valid or no TTL set
         """
-        if self.expires_at is None:
+        expires_at = self.expires_at
+        if expires_at is None:
             return False
-        return datetime.now(timezone.utc) > self.expires_at
+        self._expires_ns = _deadline_ns(expires_at, self._expires_ns)
+        return time.time_ns() > self._expires_ns[1]
 
     @classmethod
     def generate(
@@ -121,14 +173,16 @@ class VerificationIdentity:
             private_key_b64 = base64.b64encode(key_seed[:32].encode()).decode("ascii")
             public_key_b64 = base64.b64encode(key_seed[32:].encode()).decode("ascii")
 
+        now = datetime.now(timezone.utc)
         return cls(
             did=did,
             agent_name=agent_name,
             public_key=public_key_b64,
             private_key=private_key_b64,
             capabilities=capabilities or [],
+            created_at=now,
             expires_at=(
-                datetime.now(timezone.utc) + timedelta(seconds=ttl_seconds)
+                now + timedelta(seconds=ttl_seconds)
                 if ttl_seconds is not None
                 else None
             ),
@@ -150,11 +204,7 @@ class VerificationIdentity:
             raise ValueError("Cannot sign without private key")
 
         if CRYPTO_AVAILABLE:
-            private_key_bytes = base64.b64decode(self.private_key)
-            private_key_obj = ed25519.Ed25519PrivateKey.from_private_bytes(
-                private_key_bytes
-            )
-            signature_bytes = private_key_obj.sign(data.encode("utf-8"))
+            signature_bytes = self._private_key_object().sign(data.encode("utf-8"))
             signature_b64 = base64.b64encode(signature_bytes).decode("ascii")
         else:
             # Fallback simulation
@@ -183,12 +233,8 @@ class VerificationIdentity:
 
         if CRYPTO_AVAILABLE:
             try:
-                public_key_bytes = base64.b64decode(self.public_key)
-                public_key_obj = ed25519.Ed25519PublicKey.from_public_bytes(
-                    public_key_bytes
-                )
                 signature_bytes = base64.b64decode(signature.signature)
-                public_key_obj.verify(signature_bytes, data.encode("utf-8"))
+                self._public_key_object().verify(signature_bytes, data.encode("utf-8"))
                 return True
             except (InvalidSignature, ValueError):
                 return False
@@ -196,6 +242,42 @@ class VerificationIdentity:
             # Fallback verification (less secure, for demo only)
             return len(signature.signature) > 0
 
+    def verify_batch(
+        self, items: List[Tuple[str, VerificationSignature]]
+    ) -> List[bool]:
+        """Verify many ``(data, signature)`` pairs against this identity.
+
+        The public key is parsed once and reused for every pair, so this
+        is cheaper than calling :meth:`verify_signature` in a loop.
+
+        Args:
+            items: Pairs of original data and the signature over it
+
+        Returns:
+            One boolean per pair, in input order
+        """
+        if not CRYPTO_AVAILABLE:
+            return [self.verify_signature(data, sig) for data, sig in items]
+
+        try:
+            verify = self._public_key_object().verify
+        except ValueError:
+            return [False] * len(items)
+
+        public_key = self.public_key
+        b64decode = base64.b64decode
+        results: List[bool] = []
+        for data, signature in items:
+            if signature.public_key != public_key:
+                results.append(False)
+                continue
+            try:
+                verify(b64decode(signature.signature), data.encode("utf-8"))
+                results.append(True)
+            except (InvalidSignature, ValueError):
+                results.append(False)
+        return results
+
     def to_dict(self) -> Dict[str, Any]:
         """Serialize identity to dictionary (excludes private key)."""
         result = {
@@ -260,12 +342,17 @@ class UserContext:
     issued_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
     expires_at: Optional[datetime] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
+    _expires_ns: Optional[Tuple[datetime, int]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def is_valid(self) -> bool:
         """Check if the user context is still valid."""
-        if self.expires_at and datetime.now(timezone.utc) > self.expires_at:
-            return False
-        return True
+        expires_at = self.expires_at
+        if expires_at is None:
+            return True
+        self._expires_ns = _deadline_ns(expires_at, self._expires_ns)
+        return time.time_ns() <= self._expires_ns[1]
 
     def has_permission(self, permission: str) -> bool:
         """Check if the user has a specific permission."""
@@ -6,15 +6,61 @@ agent cards, handshakes, and scope chains.
 
 from __future__ import annotations
 
+import hashlib
+import heapq
 import json
+import sys
+import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional
+from itertools import islice
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
 
 from langchain_agentmesh.identity import VerificationIdentity, VerificationSignature, UserContext
 
+# json.dumps builds a fresh JSONEncoder whenever non-default options are
+# passed; reuse configured encoders instead. The output is byte-identical,
+# so signatures produced by earlier releases still verify.
+_encode_card = json.JSONEncoder(sort_keys=True, separators=(",", ":")).encode
+_encode_delegation = json.JSONEncoder(sort_keys=True).encode
+# Matches orjson's compact UTF-8 output for to_json_bytes
+_encode_json_bytes = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False).encode
+
+# Delegation signing formats. "json" is the original sort_keys JSON
+# payload, kept so previously issued delegations still verify; new
+# delegations are signed over a length-prefixed encoding instead.
+DELEGATION_FORMAT_JSON = "json"
+DELEGATION_FORMAT_CANONICAL = "canonical-v1"
+_DELEGATION_FORMATS = frozenset((DELEGATION_FORMAT_JSON, DELEGATION_FORMAT_CANONICAL))
+
+
+def _canonical_delegation_content(
+    delegator: str, delegatee: str, capabilities: Tuple[str, ...], expires_at: Optional[datetime]
+) -> str:
+    """Encode delegation fields as ``len:value,`` items behind a version tag."""
+    fields = (delegator, delegatee, expires_at.isoformat() if expires_at else "", *capabilities)
+    return "delegation/1;" + "".join([f"{len(value)}:{value}," for value in fields])
+
+
+_DID_PREFIX = "did:verification:"
+
+
+def _intern(value: str) -> str:
+    """Intern exact ``str`` values so repeated DIDs/capabilities share storage."""
+    return sys.intern(value) if type(value) is str else value
 
-@dataclass
+
+# ``slots=True`` drops the per-instance ``__dict__`` (Python 3.10+).
+_DATACLASS_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class TrustPolicy:
     """Policy configuration for trust verification."""
 
@@ -24,9 +70,10 @@ class TrustPolicy:
     audit_all_calls: bool = False
     block_unverified: bool = True
     cache_ttl_seconds: int = 900  # 15 minutes
+    cache_max_entries: int = 10_000
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class TrustVerificationResult:
     """Result of a trust verification operation."""
 
@@ -37,7 +84,7 @@ class TrustVerificationResult:
     warnings: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class TrustedAgentCard:
     """Agent card containing identity and trust information.
 
@@ -53,18 +100,72 @@ class TrustedAgentCard:
     scope_chain: Optional[List["Delegation"]] = None
     user_context: Optional[UserContext] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
+    # Signable JSON, keyed by the field values it was built from
+    _signable_cache: Optional[Tuple[Tuple[Any, ...], str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # Capability lookup set, tagged with the signable string it matches
+    _capability_cache: Optional[Tuple[str, FrozenSet[str]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # (signable, signature object, signature, public key) last verified
+    _verified_signature: Optional[Tuple[str, VerificationSignature, str, str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        # Keep capabilities in canonical order so signing re-sorts an
+        # already-sorted list, which is a single linear pass.
+        self.capabilities = sorted([_intern(c) for c in self.capabilities])
 
     def _get_signable_content(self) -> str:
         """Get deterministic content for signing."""
-        content = {
-            "name": self.name,
-            "description": self.description,
-            "capabilities": sorted(self.capabilities),
-            "trust_score": self.trust_score,
-            "identity_did": self.identity.did if self.identity else None,
-            "identity_public_key": self.identity.public_key if self.identity else None,
-        }
-        return json.dumps(content, sort_keys=True, separators=(",", ":"))
+        identity = self.identity
+        key = (
+            self.name,
+            self.description,
+            tuple(self.capabilities),
+            self.trust_score,
+            identity.did if identity else None,
+            identity.public_key if identity else None,
+        )
+        cached = self._signable_cache
+        if cached is None or cached[0] != key:
+            content = {
+                "name": key[0],
+                "description": key[1],
+                "capabilities": sorted(key[2]),
+                "trust_score": key[3],
+                "identity_did": key[4],
+                "identity_public_key": key[5],
+            }
+            signable = _encode_card(content)
+            cached = self._signable_cache = (key, signable)
+        return cached[1]
+
+    def _capability_set(self) -> FrozenSet[str]:
+        """Return the capabilities as a frozenset for membership checks.
+
+        The signable string is rebuilt whenever capabilities change, so it
+        doubles as the staleness check for this set.
+        """
+        signable = self._get_signable_content()
+        cached = self._capability_cache
+        if cached is None or cached[0] is not signable:
+            cached = self._capability_cache = (signable, frozenset(self.capabilities))
+        return cached[1]
+
+    def _signed_digest(self) -> bytes:
+        """16-byte BLAKE2b digest of the signable content and card signature.
+
+        Used as a memo key for verification results, never as a signature.
+        """
+        signature = self.card_signature
+        digest = hashlib.blake2b(digest_size=16)
+        for part in (self._get_signable_content(), signature.public_key, signature.signature):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\x00")
+        return digest.digest()
 
     def sign(self, identity: VerificationIdentity) -> None:
         """Cryptographically sign this card with the given identity.
@@ -82,11 +183,29 @@ class TrustedAgentCard:
         Returns:
             True if signature is valid, False otherwise
         """
-        if not self.identity or not self.card_signature:
+        identity = self.identity
+        card_signature = self.card_signature
+        if not identity or not card_signature:
             return False
 
         signable = self._get_signable_content()
-        return self.identity.verify_signature(signable, self.card_signature)
+        # The signable string is cached, so an unchanged card returns the
+        # very same object and a repeat check needs no crypto.
+        verified = self._verified_signature
+        if (
+            verified is not None
+            and verified[0] is signable
+            and verified[1] is card_signature
+            and verified[2] == card_signature.signature
+            and verified[3] == card_signature.public_key
+        ):
+            return True
+        if not identity.verify_signature(signable, card_signature):
+            return False
+        self._verified_signature = (
+            signable, card_signature, card_signature.signature, card_signature.public_key
+        )
+        return True
 
     def to_json(self) -> Dict[str, Any]:
         """Serialize card to JSON-compatible dictionary."""
@@ -112,6 +231,17 @@ class TrustedAgentCard:
 
         return result
 
+    def to_json_bytes(self) -> bytes:
+        """Serialize card to compact UTF-8 JSON bytes.
+
+        Uses orjson when it is installed; the json fallback writes the same
+        bytes.
+        """
+        data = self.to_json()
+        if orjson is not None:
+            return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+        return _encode_json_bytes(data).encode("utf-8")
+
     @classmethod
     def from_json(cls, data: Dict[str, Any]) -> "TrustedAgentCard":
         """Deserialize card from JSON dictionary."""
@@ -144,7 +274,7 @@ class TrustedAgentCard:
         )
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class Delegation:
     """A delegation of capabilities from one agent to another."""
 
@@ -154,6 +284,43 @@ class Delegation:
     signature: Optional[VerificationSignature] = None
     created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
     expires_at: Optional[datetime] = None
+    signing_format: str = DELEGATION_FORMAT_JSON
+    # Signable content, keyed by the field values it was built from
+    _signable_cache: Optional[Tuple[Tuple[Any, ...], str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        self.delegator = _intern(self.delegator)
+        self.delegatee = _intern(self.delegatee)
+        self.capabilities = sorted([_intern(c) for c in self.capabilities])
+
+    def _get_signable_content(self) -> str:
+        """Get deterministic content for signing."""
+        key = (
+            self.delegator,
+            self.delegatee,
+            tuple(self.capabilities),
+            self.expires_at,
+            self.signing_format,
+        )
+        cached = self._signable_cache
+        if cached is None or cached[0] != key:
+            if key[4] == DELEGATION_FORMAT_CANONICAL:
+                signable = _canonical_delegation_content(
+                    key[0], key[1], tuple(sorted(key[2])), key[3]
+                )
+            elif key[4] == DELEGATION_FORMAT_JSON:
+                signable = _encode_delegation({
+                    "delegator": key[0],
+                    "delegatee": key[1],
+                    "capabilities": sorted(key[2]),
+                    "expires_at": key[3].isoformat() if key[3] else None,
+                })
+            else:
+                raise ValueError(f"Unknown delegation signing format: {key[4]!r}")
+            cached = self._signable_cache = (key, signable)
+        return cached[1]
 
     def to_dict(self) -> Dict[str, Any]:
         """Serialize delegation to dictionary."""
@@ -167,6 +334,8 @@ class Delegation:
             result["signature"] = self.signature.to_dict()
         if self.expires_at:
             result["expires_at"] = self.expires_at.isoformat()
+        if self.signing_format != DELEGATION_FORMAT_JSON:
+            result["signing_format"] = self.signing_format
         return result
 
     @classmethod
@@ -187,6 +356,7 @@ class Delegation:
             signature=signature,
             created_at=datetime.fromisoformat(data["created_at"]),
             expires_at=expires_at,
+            signing_format=data.get("signing_format", DELEGATION_FORMAT_JSON),
         )
 
 
@@ -206,26 +376,50 @@ class TrustHandshake:
         """
         self.my_identity = my_identity
         self.policy = policy or TrustPolicy()
-        self._verified_peers: Dict[str, tuple[TrustVerificationResult, datetime]] = {}
-        self._cache_ttl = timedelta(seconds=self.policy.cache_ttl_seconds)
+        # card digest -> (result, time.monotonic() deadline)
+        self._verified_peers: Dict[bytes, Tuple[TrustVerificationResult, float]] = {}
+        self._cache_ttl_s = float(self.policy.cache_ttl_seconds)
+        self._cache_max_entries = self.policy.cache_max_entries
+        # (deadline, key) min-heap; entries whose deadline no longer matches
+        # _verified_peers are stale and skipped when popped.
+        self._expiry_heap: List[Tuple[float, bytes]] = []
+
+    @staticmethod
+    def _cache_key(peer_card: TrustedAgentCard) -> bytes:
+        """Digest of everything a cached result depends on.
+
+        Covers the signed content and the signature itself, so an altered
+        or re-signed card for the same DID never hits a stale entry.
+        """
+        return peer_card._signed_digest() + (b"\x01" if peer_card.scope_chain else b"\x00")
 
-    def _get_cached_result(self, did: str) -> Optional[TrustVerificationResult]:
+    def _get_cached_result(self, key: bytes) -> Optional[TrustVerificationResult]:
         """Get cached verification result if still valid."""
-        if did in self._verified_peers:
-            result, timestamp = self._verified_peers[did]
-            if datetime.now(timezone.utc) - timestamp < self._cache_ttl:
-                return result
-            del self._verified_peers[did]
+        entry = self._verified_peers.get(key)
+        if entry is not None:
+            if time.monotonic() < entry[1]:
+                return entry[0]
+            del self._verified_peers[key]
         return None
 
-    def _cache_result(self, did: str, result: TrustVerificationResult) -> None:
-        """Cache a verification result."""
-        self._verified_peers[did] = (result, datetime.now(timezone.utc))
+    def _cache_result(self, key: bytes, result: TrustVerificationResult) -> None:
+        """Cache a verification result, evicting expired or excess entries."""
+        now = time.monotonic()
+        deadline = now + self._cache_ttl_s
+        peers = self._verified_peers
+        heap = self._expiry_heap
+        peers[key] = (result, deadline)
+        heapq.heappush(heap, (deadline, key))
+        while heap and (heap[0][0] <= now or len(peers) > self._cache_max_entries):
+            stale_deadline, stale_key = heapq.heappop(heap)
+            entry = peers.get(stale_key)
+            if entry is not None and entry[1] == stale_deadline:
+                del peers[stale_key]
 
     def verify_peer(
         self,
         peer_card: TrustedAgentCard,
-        required_capabilities: Optional[List[str]] = None,
+        required_capabilities: Optional[Iterable[str]] = None,
         min_trust_score: Optional[float] = None,
     ) -> TrustVerificationResult:
         """Verify a peer agent's trustworthiness.
@@ -238,17 +432,11 @@ class TrustHandshake:
         Returns:
             TrustVerificationResult with verification status
         """
-        warnings: List[str] = []
         min_score = min_trust_score or self.policy.min_trust_score
-
-        # Check for cached result
-        if peer_card.identity:
-            cached = self._get_cached_result(peer_card.identity.did)
-            if cached:
-                return cached
+        identity = peer_card.identity
 
         # Verify identity exists
-        if not peer_card.identity:
+        if not identity:
             return TrustVerificationResult(
                 trusted=False,
                 trust_score=0.0,
@@ -256,15 +444,17 @@ class TrustHandshake:
             )
 
         # Verify DID format
-        if not peer_card.identity.did.startswith("did:verification:"):
+        if not identity.did.startswith(_DID_PREFIX):
             return TrustVerificationResult(
                 trusted=False,
                 trust_score=0.0,
                 reason="Invalid DID format",
             )
 
-        # Verify card signature
-        if not peer_card.verify_signature():
+        # Verify card signature, unless this exact card already passed
+        cache_key = self._cache_key(peer_card) if peer_card.card_signature else None
+        cached = self._get_cached_result(cache_key) if cache_key else None
+        if cached is None and not peer_card.verify_signature():
             return TrustVerificationResult(
                 trusted=False,
                 trust_score=0.0,
@@ -272,26 +462,33 @@ class TrustHandshake:
             )
 
         # Check trust score
-        if peer_card.trust_score < min_score:
+        trust_score = peer_card.trust_score
+        if trust_score < min_score:
             return TrustVerificationResult(
                 trusted=False,
-                trust_score=peer_card.trust_score,
-                reason=f"Trust score {peer_card.trust_score} below minimum {min_score}",
+                trust_score=trust_score,
+                reason=f"Trust score {trust_score} below minimum {min_score}",
             )
 
         # Verify capabilities
-        verified_caps = peer_card.capabilities.copy()
+        capabilities = peer_card.capabilities
         if required_capabilities:
-            missing = set(required_capabilities) - set(peer_card.capabilities)
+            available = peer_card._capability_set()
+            missing = {c for c in required_capabilities if c not in available}
             if missing:
                 return TrustVerificationResult(
                     trusted=False,
-                    trust_score=peer_card.trust_score,
+                    trust_score=trust_score,
                     reason=f"Missing required capabilities: {missing}",
-                    verified_capabilities=verified_caps,
+                    verified_capabilities=capabilities.copy(),
                 )
 
+        # The remaining checks produce the same result for the same card
+        if cached is not None:
+            return cached
+
         # Check scope chain if present
+        warnings: List[str] = []
         if peer_card.scope_chain:
             # TODO: A full cryptographic verification of the scope chain is needed.
             # This should verify the signature of each delegation and the integrity of the
@@ -303,20 +500,21 @@ class TrustHandshake:
         # All checks passed
         result = TrustVerificationResult(
             trusted=True,
-            trust_score=peer_card.trust_score,
+            trust_score=trust_score,
             reason="Verification successful",
-            verified_capabilities=verified_caps,
+            verified_capabilities=capabilities.copy(),
             warnings=warnings,
         )
 
         # Cache result
-        self._cache_result(peer_card.identity.did, result)
+        self._cache_result(cache_key, result)
 
         return result
 
     def clear_cache(self) -> None:
         """Clear all cached verification results."""
         self._verified_peers.clear()
+        self._expiry_heap.clear()
 
 
 class DelegationChain:
@@ -333,6 +531,22 @@ class DelegationChain:
         self._known_identities: Dict[str, VerificationIdentity] = {
             root_identity.did: root_identity
         }
+        # Delegations grouped by delegatee, tagged with the list object and
+        # length they were built from so direct edits to it trigger a rebuild
+        self._by_delegatee: Optional[
+            Tuple[List[Delegation], int, Dict[str, List[Delegation]]]
+        ] = None
+
+    def _delegations_to(self, agent_did: str) -> List[Delegation]:
+        """Return the delegations whose delegatee is *agent_did*."""
+        delegations = self.delegations
+        cached = self._by_delegatee
+        if cached is None or cached[0] is not delegations or cached[1] != len(delegations):
+            index: Dict[str, List[Delegation]] = {}
+            for delegation in delegations:
+                index.setdefault(delegation.delegatee, []).append(delegation)
+            cached = self._by_delegatee = (delegations, len(delegations), index)
+        return cached[2].get(agent_did, [])
 
     def add_delegation(
         self,
@@ -365,25 +579,25 @@ class DelegationChain:
         if expires_in_hours:
             expires_at = datetime.now(timezone.utc) + timedelta(hours=expires_in_hours)
 
-        # Create delegation data for signing
-        delegation_data = json.dumps({
-            "delegator": delegator.did,
-            "delegatee": delegatee_did,
-            "capabilities": sorted(capabilities),
-            "expires_at": expires_at.isoformat() if expires_at else None,
-        }, sort_keys=True)
-
-        # Sign with delegator's identity
-        signature = delegator.sign(delegation_data)
-
         delegation = Delegation(
             delegator=delegator.did,
             delegatee=delegatee_did,
             capabilities=capabilities,
-            signature=signature,
             expires_at=expires_at,
+            signing_format=DELEGATION_FORMAT_CANONICAL,
         )
 
+        # Sign with delegator's identity
+        delegation.signature = delegator.sign(delegation._get_signable_content())
+
+        cached = self._by_delegatee
+        if (
+            cached is not None
+            and cached[0] is self.delegations
+            and cached[1] == len(self.delegations)
+        ):
+            cached[2].setdefault(delegatee_did, []).append(delegation)
+            self._by_delegatee = (cached[0], cached[1] + 1, cached[2])
         self.delegations.append(delegation)
 
         # Track known identities
@@ -400,37 +614,40 @@ class DelegationChain:
         if not self.delegations:
             return True
 
-        for i, delegation in enumerate(self.delegations):
+        delegations = self.delegations
+
+        # Verify chain linkage: each delegator is the previous delegatee
+        for prev_delegation, delegation in zip(delegations, islice(delegations, 1, None)):
+            if delegation.delegator != prev_delegation.delegatee:
+                return False
+
+        now = datetime.now(timezone.utc)
+        known_identities = self._known_identities
+        # Signable payloads grouped by delegator DID, checked after the loop
+        pending: Dict[str, List[Tuple[str, VerificationSignature]]] = {}
+        for delegation in delegations:
             # Check expiration
-            if delegation.expires_at and delegation.expires_at < datetime.now(timezone.utc):
+            if delegation.expires_at and delegation.expires_at < now:
                 return False
 
             # Verify signature
-            if not delegation.signature:
+            if not delegation.signature or delegation.signing_format not in _DELEGATION_FORMATS:
                 return False
 
             # Get delegator identity
-            delegator_identity = self._known_identities.get(delegation.delegator)
-            if not delegator_identity:
+            if delegation.delegator not in known_identities:
                 return False
 
-            # Verify delegation signature
-            delegation_data = json.dumps({
-                "delegator": delegation.delegator,
-                "delegatee": delegation.delegatee,
-                "capabilities": sorted(delegation.capabilities),
-                "expires_at": delegation.expires_at.isoformat() if delegation.expires_at else None,
-            }, sort_keys=True)
+            pending.setdefault(delegation.delegator, []).append(
+                (delegation._get_signable_content(), delegation.signature)
+            )
 
-            if not delegator_identity.verify_signature(delegation_data, delegation.signature):
+        # Verify delegation signatures only once the chain is structurally
+        # sound, one batch per delegator so each public key is parsed once
+        for delegator_did, items in pending.items():
+            if not all(known_identities[delegator_did].verify_batch(items)):
                 return False
 
-            # Verify chain linkage (except for first delegation from root)
-            if i > 0:
-                prev_delegation = self.delegations[i - 1]
-                if delegation.delegator != prev_delegation.delegatee:
-                    return False
-
         return True
 
     def get_delegated_capabilities(self, agent_did: str) -> List[str]:
@@ -442,14 +659,14 @@ class DelegationChain:
         Returns:
             List of delegated capabilities
         """
-        capabilities: List[str] = []
-        for delegation in self.delegations:
-            if delegation.delegatee == agent_did:
-                # Check if delegation is still valid
-                if delegation.expires_at and delegation.expires_at < datetime.now(timezone.utc):
-                    continue
-                capabilities.extend(delegation.capabilities)
-        return list(set(capabilities))
+        now = datetime.now(timezone.utc)
+        capabilities: Set[str] = set()
+        for delegation in self._delegations_to(agent_did):
+            # Check if delegation is still valid
+            if delegation.expires_at and delegation.expires_at < now:
+                continue
+            capabilities.update(delegation.capabilities)
+        return list(capabilities)
 
 
 class AgentDirectory:
@@ -458,10 +675,29 @@ class AgentDirectory:
     Provides a framework-level registry so agents can find each other
     by DID or capability without a centralized service dependency.
     Pairs with the core AgentMesh Registry for production deployments.
+
+    Queries read each card's current fields, so a card edited after
+    registration is found by its new capabilities and trust score.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, max_verified_payloads: int = 10_000) -> None:
+        """Initialize an empty directory.
+
+        Args:
+            max_verified_payloads: How many card payload verification
+                results to remember before evicting the least recently used
+        """
         self._cards: Dict[str, TrustedAgentCard] = {}  # did -> card
+        # Card payload digest -> signature verification result, in LRU order
+        self._verified_payloads: OrderedDict[bytes, bool] = OrderedDict()
+        self._max_verified_payloads = max_verified_payloads
+
+    def _remember_payload(self, payload_key: bytes, valid: bool) -> None:
+        """Record a verification result, evicting the oldest past the cap."""
+        verified_payloads = self._verified_payloads
+        verified_payloads[payload_key] = valid
+        if len(verified_payloads) > self._max_verified_payloads:
+            verified_payloads.popitem(last=False)
 
     def register(self, card: TrustedAgentCard) -> bool:
         """Register an agent card after verifying its signature.
@@ -472,13 +708,54 @@ class AgentDirectory:
         Returns:
             True if registered, False if signature verification failed
         """
-        if not card.identity:
+        if not card.identity or not card.card_signature:
             return False
-        if not card.verify_signature():
+        payload_key = card._signed_digest()
+        valid = self._verified_payloads.get(payload_key)
+        if valid is None:
+            valid = card.verify_signature()
+            self._remember_payload(payload_key, valid)
+        else:
+            self._verified_payloads.move_to_end(payload_key)
+        if not valid:
             return False
-        self._cards[card.identity.did] = card
+        self._cards[_intern(card.identity.did)] = card
         return True
 
+    def register_many(self, cards: Iterable[TrustedAgentCard]) -> List[bool]:
+        """Register several agent cards, e.g. when loading a snapshot.
+
+        Args:
+            cards: The agent cards to register
+
+        Returns:
+            One flag per card, in input order, as returned by :meth:`register`
+        """
+        cards = list(cards)
+
+        # Pre-verify cards that share a signing key as one batch, so the key
+        # is parsed once; register() then finds them in _verified_payloads.
+        verified_payloads = self._verified_payloads
+        by_signer: Dict[str, List[Tuple[TrustedAgentCard, bytes]]] = {}
+        for card in cards:
+            if card.identity and card.card_signature:
+                payload_key = card._signed_digest()
+                if payload_key not in verified_payloads:
+                    by_signer.setdefault(card.identity.public_key, []).append(
+                        (card, payload_key)
+                    )
+        for pending in by_signer.values():
+            if len(pending) < 2:
+                continue
+            results = pending[0][0].identity.verify_batch(
+                [(card._get_signable_content(), card.card_signature) for card, _ in pending]
+            )
+            for (_, payload_key), valid in zip(pending, results):
+                self._remember_payload(payload_key, valid)
+
+        register = self.register
+        return [register(card) for card in cards]
+
     def find_by_did(self, did: str) -> Optional[TrustedAgentCard]:
         """Look up an agent by DID.
 
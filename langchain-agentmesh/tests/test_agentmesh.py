@@ -1,5 +1,10 @@
 """Tests for AgentMesh LangChain integration."""
 
+import copy
+import json
+import pickle
+import sys
+
 import pytest
 from datetime import datetime, timedelta, timezone
 from langchain_agentmesh import (
@@ -8,10 +13,12 @@ from langchain_agentmesh import (
     TrustedAgentCard,
     TrustHandshake,
     TrustPolicy,
+    TrustVerificationResult,
     TrustGatedTool,
     TrustedToolExecutor,
     TrustCallbackHandler,
     DelegationChain,
+    Delegation,
     UserContext,
     AgentDirectory,
 )
@@ -52,6 +59,30 @@ class TestVerificationIdentity:
         # Verification should fail with different data
         assert not identity.verify_signature("tampered data", signature)
 
+    def test_verify_batch(self):
+        """Batch verification reports each pair independently."""
+        identity = VerificationIdentity.generate("batch-agent")
+        other = VerificationIdentity.generate("other-agent")
+        items = [
+            ("a", identity.sign("a")),
+            ("b", identity.sign("not b")),
+            ("c", other.sign("c")),
+        ]
+        assert identity.verify_batch(items) == [True, False, False]
+
+    def test_key_objects_cached(self):
+        """Parsed key objects are reused and rebuilt when the key changes."""
+        identity = VerificationIdentity.generate("cache-agent")
+        identity.sign("first")
+        cached = identity._private_key_cache
+        identity.sign("second")
+        assert identity._private_key_cache is cached
+
+        other = VerificationIdentity.generate("other-agent")
+        identity.public_key, identity.private_key = other.public_key, other.private_key
+        signature = identity.sign("rotated")
+        assert other.verify_signature("rotated", signature)
+
     def test_public_identity(self):
         """Test public identity excludes private key."""
         identity = VerificationIdentity.generate("test-agent")
@@ -80,6 +111,21 @@ class TestTrustedAgentCard:
         assert card.card_signature is not None
         assert card.verify_signature()
 
+    def test_pickle_and_deepcopy_after_signing(self):
+        """Cards and identities stay copyable once key objects are cached."""
+        identity = VerificationIdentity.generate("pickle-agent")
+        card = TrustedAgentCard(name="Pickle Agent", description="", capabilities=["a"])
+        card.sign(identity)
+        assert card.verify_signature()
+
+        for restored in (pickle.loads(pickle.dumps(card)), copy.deepcopy(card)):
+            assert restored.identity.did == identity.did
+            assert restored.verify_signature()
+
+        for restored_identity in (pickle.loads(pickle.dumps(identity)), copy.deepcopy(identity)):
+            signature = restored_identity.sign("data")
+            assert restored_identity.verify_signature("data", signature)
+
     def test_serialization(self):
         """Test card JSON serialization."""
         identity = VerificationIdentity.generate("json-agent")
@@ -97,6 +143,120 @@ class TestTrustedAgentCard:
         assert restored.capabilities == card.capabilities
         assert restored.identity.did == card.identity.did
 
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need 3.10+")
+    def test_card_has_no_instance_dict(self):
+        """Test cards use slotted storage."""
+        card = TrustedAgentCard(name="Slim", description="", capabilities=[])
+        assert not hasattr(card, "__dict__")
+
+    def test_capabilities_are_interned(self):
+        """Test equal capability names share one string object."""
+        first = TrustedAgentCard(name="A", description="", capabilities=["".join(["re", "ad"])])
+        second = TrustedAgentCard(name="B", description="", capabilities=["".join(["r", "ead"])])
+        assert first.capabilities[0] is second.capabilities[0]
+
+    def test_capabilities_sorted_on_construction(self):
+        """Test capabilities are stored in canonical order."""
+        caps = ["write", "admin", "read"]
+        card = TrustedAgentCard(name="A", description="", capabilities=caps)
+        assert card.capabilities == ["admin", "read", "write"]
+        assert caps == ["write", "admin", "read"]
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_to_json_bytes(self, monkeypatch, use_orjson):
+        """Test byte serialization matches to_json with and without orjson."""
+        if not use_orjson:
+            monkeypatch.setattr("langchain_agentmesh.trust.orjson", None)
+        card = TrustedAgentCard(
+            name="Bytes Agent",
+            description="Serializes to bytes",
+            capabilities=["serialize"],
+            metadata={"region": "eu"},
+        )
+        card.sign(VerificationIdentity.generate("bytes-agent"))
+
+        payload = card.to_json_bytes()
+        assert isinstance(payload, bytes)
+        assert json.loads(payload) == card.to_json()
+
+    def test_to_json_bytes_same_without_orjson(self, monkeypatch):
+        """Test both serialization backends produce identical bytes."""
+        pytest.importorskip("orjson")
+        card = TrustedAgentCard(
+            name="Caf\u00e9 Agent",
+            description="Serializes \u2603 to bytes",
+            capabilities=["serialize"],
+            metadata={"region": "eu", "limits": {"rpm": 60, "burst": 1.5}},
+        )
+        card.sign(VerificationIdentity.generate("bytes-agent"))
+
+        with_orjson = card.to_json_bytes()
+        monkeypatch.setattr("langchain_agentmesh.trust.orjson", None)
+        assert card.to_json_bytes() == with_orjson
+        assert "\u2603".encode("utf-8") in with_orjson
+
+    def test_mutation_after_signing_invalidates_signature(self):
+        """Test cached signable content tracks field changes."""
+        identity = VerificationIdentity.generate("mutable-agent")
+        card = TrustedAgentCard(
+            name="Mutable Agent",
+            description="Changes after signing",
+            capabilities=["read"],
+        )
+        card.sign(identity)
+        assert card.verify_signature()
+
+        card.capabilities[0] = "admin"
+        assert not card.verify_signature()
+
+        card.capabilities[0] = "read"
+        assert card.verify_signature()
+
+        card.trust_score = 0.5
+        assert not card.verify_signature()
+
+    def test_repeat_verification_skips_crypto(self, monkeypatch):
+        """Test an unchanged card is only checked cryptographically once."""
+        identity = VerificationIdentity.generate("repeat-agent")
+        card = TrustedAgentCard(name="Repeat", description="", capabilities=["read"])
+        card.sign(identity)
+
+        calls = []
+        original = VerificationIdentity.verify_signature
+
+        def counting_verify(self, data, signature):
+            calls.append(data)
+            return original(self, data, signature)
+
+        monkeypatch.setattr(VerificationIdentity, "verify_signature", counting_verify)
+        assert card.verify_signature()
+        assert card.verify_signature()
+        assert len(calls) == 1
+
+        card.card_signature.signature = identity.sign("something else").signature
+        assert not card.verify_signature()
+        assert len(calls) == 2
+
+    def test_signable_content_format_is_stable(self):
+        """Test signable content matches the original json.dumps layout."""
+        identity = VerificationIdentity.generate("stable-agent")
+        card = TrustedAgentCard(
+            name="Agënt",
+            description="Non-ASCII names must keep their escaping",
+            capabilities=["write", "read"],
+            trust_score=1e-05,
+        )
+        card.sign(identity)
+        expected = json.dumps({
+            "name": card.name,
+            "description": card.description,
+            "capabilities": ["read", "write"],
+            "trust_score": card.trust_score,
+            "identity_did": card.identity.did,
+            "identity_public_key": card.identity.public_key,
+        }, sort_keys=True, separators=(",", ":"))
+        assert card._get_signable_content() == expected
+
 
 class TestTrustHandshake:
     """Tests for TrustHandshake class."""
@@ -143,6 +303,35 @@ class TestTrustHandshake:
         assert not result.trusted
         assert "Missing required capabilities" in result.reason
 
+    def test_verify_rejects_malformed_did(self):
+        """Test DIDs without the verification prefix fail."""
+        handshake = TrustHandshake(VerificationIdentity.generate("my-agent"))
+        for did in ("did:other:abc", "verification:abc"):
+            identity = VerificationIdentity.generate("peer-agent")
+            identity.did = did
+            card = TrustedAgentCard(name="Peer", description="", capabilities=[])
+            card.sign(identity)
+            result = handshake.verify_peer(card)
+            assert not result.trusted
+            assert result.reason == "Invalid DID format"
+
+    def test_capability_set_tracks_mutation(self):
+        """Test the cached capability set follows in-place edits."""
+        card = TrustedAgentCard(name="Caps", description="", capabilities=["read"])
+        assert card._capability_set() == {"read"}
+        card.capabilities[0] = "write"
+        assert card._capability_set() == {"write"}
+
+    def test_required_capabilities_accepts_frozenset(self):
+        """Test required capabilities may be any iterable."""
+        peer_card = TrustedAgentCard(name="Peer", description="", capabilities=["a", "b"])
+        peer_card.sign(VerificationIdentity.generate("peer-agent"))
+        handshake = TrustHandshake(VerificationIdentity.generate("my-agent"))
+        assert handshake.verify_peer(peer_card, required_capabilities=frozenset({"a"})).trusted
+        result = handshake.verify_peer(peer_card, required_capabilities=("a", "c"))
+        assert not result.trusted
+        assert result.reason == "Missing required capabilities: {'c'}"
+
     def test_cache_ttl(self):
         """Test that verification results are cached."""
         my_identity = VerificationIdentity.generate("my-agent")
@@ -164,6 +353,88 @@ class TestTrustHandshake:
         
         assert result1.trusted == result2.trusted
 
+    def test_cache_expires_after_ttl(self, monkeypatch):
+        """Test cached results are dropped once the TTL elapses."""
+        peer_identity = VerificationIdentity.generate("peer-agent")
+        peer_card = TrustedAgentCard(name="Peer", description="", capabilities=[])
+        peer_card.sign(peer_identity)
+
+        handshake = TrustHandshake(
+            VerificationIdentity.generate("my-agent"),
+            TrustPolicy(cache_ttl_seconds=60),
+        )
+        clock = [1000.0]
+        monkeypatch.setattr("langchain_agentmesh.trust.time.monotonic", lambda: clock[0])
+
+        result = handshake.verify_peer(peer_card)
+        key = handshake._cache_key(peer_card)
+        assert handshake._get_cached_result(key) is result
+
+        clock[0] += 61
+        assert handshake._get_cached_result(key) is None
+        assert key not in handshake._verified_peers
+
+    def test_cache_skips_signature_check_for_same_card(self, monkeypatch):
+        """Test re-presenting an identical card reuses the verified result."""
+        peer_card = TrustedAgentCard(name="Peer", description="", capabilities=["read"])
+        peer_card.sign(VerificationIdentity.generate("peer-agent"))
+        handshake = TrustHandshake(VerificationIdentity.generate("my-agent"))
+
+        calls = []
+        original = TrustedAgentCard.verify_signature
+
+        def counting_verify(card):
+            calls.append(card)
+            return original(card)
+
+        monkeypatch.setattr(TrustedAgentCard, "verify_signature", counting_verify)
+        first = handshake.verify_peer(peer_card, required_capabilities=["read"])
+        second = handshake.verify_peer(peer_card, required_capabilities=["read"])
+        assert first.trusted and second is first
+        assert len(calls) == 1
+
+        denied = handshake.verify_peer(peer_card, required_capabilities=["write"])
+        assert not denied.trusted
+        assert len(calls) == 1
+
+    def test_cache_not_reused_for_altered_card(self):
+        """Test a re-signed card for the same DID is verified afresh."""
+        peer_identity = VerificationIdentity.generate("peer-agent")
+        handshake = TrustHandshake(VerificationIdentity.generate("my-agent"))
+
+        card = TrustedAgentCard(name="Peer", description="", capabilities=["read"])
+        card.sign(peer_identity)
+        assert handshake.verify_peer(card, required_capabilities=["read"]).trusted
+
+        card.capabilities = ["write"]
+        assert not handshake.verify_peer(card).trusted
+
+        card.sign(peer_identity)
+        result = handshake.verify_peer(card, required_capabilities=["read"])
+        assert not result.trusted
+        assert "Missing required capabilities" in result.reason
+
+    def test_cache_evicts_expired_and_excess_entries(self, monkeypatch):
+        """Test caching sweeps expired peers and respects the size cap."""
+        handshake = TrustHandshake(
+            VerificationIdentity.generate("my-agent"),
+            TrustPolicy(cache_ttl_seconds=60, cache_max_entries=2),
+        )
+        clock = [1000.0]
+        monkeypatch.setattr("langchain_agentmesh.trust.time.monotonic", lambda: clock[0])
+        result = TrustVerificationResult(trusted=True, trust_score=1.0, reason="ok")
+
+        handshake._cache_result(b"a", result)
+        clock[0] += 1
+        handshake._cache_result(b"b", result)
+        clock[0] += 1
+        handshake._cache_result(b"c", result)
+        assert set(handshake._verified_peers) == {b"b", b"c"}
+
+        clock[0] += 120
+        handshake._cache_result(b"d", result)
+        assert set(handshake._verified_peers) == {b"d"}
+
 
 class TestDelegationChain:
     """Tests for DelegationChain class."""
@@ -211,6 +482,114 @@ class TestDelegationChain:
         
         assert chain.verify()
 
+    def test_verify_fails_after_capabilities_change(self):
+        """Test tampered delegation capabilities are rejected."""
+        root = VerificationIdentity.generate("root-agent")
+        worker_identity = VerificationIdentity.generate("worker-agent")
+        worker_card = TrustedAgentCard(
+            name="Worker",
+            description="Worker agent",
+            capabilities=[],
+        )
+        worker_card.sign(worker_identity)
+
+        chain = DelegationChain(root)
+        delegation = chain.add_delegation(
+            delegatee=worker_card,
+            capabilities=["read"],
+        )
+        assert chain.verify()
+
+        delegation.capabilities.append("write")
+        assert not chain.verify()
+
+    def test_get_delegated_capabilities(self):
+        """Test capabilities are merged across a delegatee's live delegations."""
+        root = VerificationIdentity.generate("root-agent")
+        worker_identity = VerificationIdentity.generate("worker-agent")
+        worker_card = TrustedAgentCard(name="Worker", description="", capabilities=[])
+        worker_card.sign(worker_identity)
+        other_card = TrustedAgentCard(name="Other", description="", capabilities=[])
+        other_card.sign(VerificationIdentity.generate("other-agent"))
+
+        chain = DelegationChain(root)
+        assert chain.get_delegated_capabilities(worker_identity.did) == []
+        chain.add_delegation(delegatee=worker_card, capabilities=["read"])
+        chain.add_delegation(delegatee=other_card, capabilities=["admin"])
+        chain.add_delegation(delegatee=worker_card, capabilities=["read", "write"])
+        assert sorted(chain.get_delegated_capabilities(worker_identity.did)) == ["read", "write"]
+
+        expired = chain.add_delegation(delegatee=worker_card, capabilities=["delete"])
+        expired.expires_at = datetime.now(timezone.utc) - timedelta(seconds=1)
+        assert "delete" not in chain.get_delegated_capabilities(worker_identity.did)
+
+        chain.delegations = [d for d in chain.delegations if d.delegatee != worker_identity.did]
+        assert chain.get_delegated_capabilities(worker_identity.did) == []
+
+    def test_legacy_json_signed_delegation_verifies(self):
+        """Test delegations signed over the original JSON payload still verify."""
+        root = VerificationIdentity.generate("root-agent")
+        worker_identity = VerificationIdentity.generate("worker-agent")
+        worker_card = TrustedAgentCard(name="Worker", description="", capabilities=[])
+        worker_card.sign(worker_identity)
+
+        chain = DelegationChain(root)
+        delegation = chain.add_delegation(delegatee=worker_card, capabilities=["write", "read"])
+        assert delegation.signing_format == "canonical-v1"
+
+        legacy_payload = json.dumps({
+            "delegator": root.did,
+            "delegatee": worker_identity.did,
+            "capabilities": ["read", "write"],
+            "expires_at": None,
+        }, sort_keys=True)
+        delegation.signing_format = "json"
+        delegation.signature = root.sign(legacy_payload)
+        assert chain.verify()
+
+        restored = Delegation.from_dict(delegation.to_dict())
+        assert restored.signing_format == "json"
+
+    def test_signing_format_round_trips(self):
+        """Test the signing format survives serialization."""
+        root = VerificationIdentity.generate("root-agent")
+        worker_identity = VerificationIdentity.generate("worker-agent")
+        worker_card = TrustedAgentCard(name="Worker", description="", capabilities=[])
+        worker_card.sign(worker_identity)
+
+        chain = DelegationChain(root)
+        delegation = chain.add_delegation(
+            delegatee=worker_card, capabilities=["read"], expires_in_hours=1
+        )
+        restored = Delegation.from_dict(delegation.to_dict())
+        assert restored.signing_format == delegation.signing_format
+        assert root.verify_signature(restored._get_signable_content(), restored.signature)
+
+        delegation.signing_format = "unknown"
+        assert not chain.verify()
+
+    def test_verify_multi_hop_chain(self):
+        """Test linked delegations verify and broken linkage is rejected."""
+        root = VerificationIdentity.generate("root-agent")
+        cards = []
+        identities = []
+        for name in ("manager", "worker"):
+            identity = VerificationIdentity.generate(name)
+            card = TrustedAgentCard(name=name, description="", capabilities=[])
+            card.sign(identity)
+            identities.append(identity)
+            cards.append(card)
+
+        chain = DelegationChain(root)
+        chain.add_delegation(delegatee=cards[0], capabilities=["read", "write"])
+        chain.add_delegation(
+            delegatee=cards[1], capabilities=["read"], delegator_identity=identities[0]
+        )
+        assert chain.verify()
+
+        chain.delegations.reverse()
+        assert not chain.verify()
+
 
 class TestTrustGatedTool:
     """Tests for TrustGatedTool class."""
@@ -302,6 +681,13 @@ class TestVerificationIdentityTTL:
         identity.expires_at = datetime.now(timezone.utc) - timedelta(seconds=10)
         assert identity.is_expired()
 
+    def test_expiry_reassignment_after_check(self):
+        """Reassigning expires_at takes effect after a cached check."""
+        identity = VerificationIdentity.generate("recheck-agent", ttl_seconds=3600)
+        assert not identity.is_expired()
+        identity.expires_at = datetime.now(timezone.utc) - timedelta(seconds=10)
+        assert identity.is_expired()
+
     def test_ttl_survives_serialization(self):
         """TTL round-trips through to_dict/from_dict."""
         identity = VerificationIdentity.generate("serial-agent", ttl_seconds=900)
@@ -344,6 +730,29 @@ class TestUserContext:
         ctx.expires_at = datetime.now(timezone.utc) - timedelta(seconds=10)
         assert not ctx.is_valid()
 
+    def test_permission_changes_seen_after_lookup(self):
+        """Permission lookups reflect appends and reassignment."""
+        ctx = UserContext.create(user_id="user-1", permissions=["read:data"])
+        assert not ctx.has_permission("write:data")
+        ctx.permissions.append("write:data")
+        assert ctx.has_permission("write:data")
+        ctx.permissions = ["read:data"]
+        assert not ctx.has_permission("write:data")
+
+    def test_same_length_permission_edits_revoke_access(self):
+        """Replacing or swapping entries without changing length is seen."""
+        ctx = UserContext.create(
+            user_id="user-1", roles=["admin"], permissions=["write:data"]
+        )
+        assert ctx.has_permission("write:data") and ctx.has_role("admin")
+        ctx.permissions.remove("write:data")
+        ctx.permissions.append("read:data")
+        assert not ctx.has_permission("write:data")
+        ctx.permissions[0] = "audit:data"
+        assert not ctx.has_permission("read:data")
+        ctx.roles[0] = "viewer"
+        assert not ctx.has_role("admin")
+
     def test_wildcard_permission(self):
         """Wildcard permission grants everything."""
         ctx = UserContext.create(user_id="admin", permissions=["*"])
@@ -449,6 +858,88 @@ class TestAgentDirectory:
         assert len(trusted) == 1
         assert trusted[0].name == "Trusted"
 
+    def test_register_many(self):
+        """Bulk registration reports a flag per card."""
+        directory = AgentDirectory()
+        signed = TrustedAgentCard(name="Signed", description="", capabilities=["read"])
+        signed.sign(VerificationIdentity.generate("signed-agent"))
+        unsigned = TrustedAgentCard(name="Unsigned", description="", capabilities=["read"])
+
+        assert directory.register_many([signed, unsigned]) == [True, False]
+        assert directory.count() == 1
+        assert directory.find_by_capability("read") == [signed]
+
+    def test_reregistering_identical_payload_skips_verification(self, monkeypatch):
+        """A card payload that already verified is not checked again."""
+        directory = AgentDirectory()
+        card = TrustedAgentCard(name="Cached", description="", capabilities=["read"])
+        card.sign(VerificationIdentity.generate("cached-agent"))
+        assert directory.register(card)
+
+        calls = []
+        monkeypatch.setattr(
+            TrustedAgentCard, "verify_signature", lambda self: calls.append(self) or False
+        )
+        assert directory.register(TrustedAgentCard.from_json(card.to_json()))
+        assert calls == []
+
+        card.trust_score = 0.1
+        assert not directory.register(card)
+        assert len(calls) == 1
+
+    def test_register_many_batches_cards_from_one_signer(self, monkeypatch):
+        """Cards signed by the same key are verified in one batch."""
+        directory = AgentDirectory()
+        signer = VerificationIdentity.generate("fleet-signer")
+        cards = []
+        for name in ("one", "two", "three"):
+            card = TrustedAgentCard(name=name, description="", capabilities=[name])
+            card.sign(signer)
+            cards.append(card)
+        forged = TrustedAgentCard(name="forged", description="", capabilities=["x"])
+        forged.sign(signer)
+        forged.trust_score = 0.99
+        cards.append(forged)
+
+        batches = []
+        original = VerificationIdentity.verify_batch
+
+        def recording_batch(self, items):
+            batches.append(len(items))
+            return original(self, items)
+
+        monkeypatch.setattr(VerificationIdentity, "verify_batch", recording_batch)
+        assert directory.register_many(cards) == [True, True, True, False]
+        assert batches == [4]
+        assert directory.find_by_did(signer.did).name == "three"
+
+    def test_verified_payload_memo_is_bounded(self):
+        """The payload memo evicts least recently used digests."""
+        directory = AgentDirectory(max_verified_payloads=2)
+        cards = []
+        for name in ("a", "b", "c"):
+            card = TrustedAgentCard(name=name, description="", capabilities=[])
+            card.sign(VerificationIdentity.generate(name))
+            cards.append(card)
+            directory.register(card)
+        assert len(directory._verified_payloads) == 2
+        assert cards[0]._signed_digest() not in directory._verified_payloads
+
+    def test_failed_verification_is_remembered(self, monkeypatch):
+        """A payload that failed verification is rejected again without crypto."""
+        directory = AgentDirectory()
+        card = TrustedAgentCard(name="Bad", description="", capabilities=[])
+        card.sign(VerificationIdentity.generate("bad-agent"))
+        card.name = "Tampered"
+        assert not directory.register(card)
+
+        calls = []
+        monkeypatch.setattr(
+            TrustedAgentCard, "verify_signature", lambda self: calls.append(self) or True
+        )
+        assert not directory.register(card)
+        assert calls == []
+
     def test_reject_unsigned_card(self):
         """Unsigned cards are rejected."""
         directory = AgentDirectory()
@@ -472,3 +963,69 @@ class TestAgentDirectory:
         assert directory.remove(identity.did)
         assert directory.count() == 0
         assert not directory.remove("nonexistent")
+
+    def test_reregister_replaces_card(self):
+        """Re-registering a DID replaces its card in every lookup."""
+        directory = AgentDirectory()
+        identity = VerificationIdentity.generate("changing-agent")
+        card = TrustedAgentCard(name="v1", description="", capabilities=["read"], trust_score=0.9)
+        card.sign(identity)
+        directory.register(card)
+
+        updated = TrustedAgentCard(name="v2", description="", capabilities=["write"], trust_score=0.5)
+        updated.sign(identity)
+        directory.register(updated)
+
+        assert directory.count() == 1
+        assert directory.find_by_capability("read") == []
+        assert directory.find_by_capability("write") == [updated]
+        assert directory.list_trusted(0.7) == []
+        assert directory.list_trusted(0.5) == [updated]
+
+    def test_remove_clears_lookups(self):
+        """Removed agents no longer appear in capability or trust queries."""
+        directory = AgentDirectory()
+        identity = VerificationIdentity.generate("indexed-agent")
+        card = TrustedAgentCard(name="Indexed", description="", capabilities=["read"])
+        card.sign(identity)
+        directory.register(card)
+
+        directory.remove(identity.did)
+        assert directory.find_by_capability("read") == []
+        assert directory.list_trusted(0.0) == []
+
+    def test_find_by_capability_uses_current_capabilities(self):
+        """Capability edits after registration are reflected without re-registering."""
+        directory = AgentDirectory()
+        card = TrustedAgentCard(name="Editable", description="", capabilities=["read"])
+        card.sign(VerificationIdentity.generate("editable-agent"))
+        directory.register(card)
+
+        card.capabilities.remove("read")
+        card.capabilities.append("write")
+        assert directory.find_by_capability("read") == []
+        assert directory.find_by_capability("write") == [card]
+
+    def test_list_trusted_keeps_registration_order(self):
+        """Trusted agents are listed in the order they were registered."""
+        directory = AgentDirectory()
+        for name, score in [("mid", 0.8), ("top", 0.95), ("low", 0.4), ("edge", 0.7)]:
+            card = TrustedAgentCard(name=name, description="", capabilities=[], trust_score=score)
+            card.sign(VerificationIdentity.generate(name))
+            directory.register(card)
+
+        assert [c.name for c in directory.list_trusted(0.7)] == ["mid", "top", "edge"]
+
+    def test_list_trusted_uses_current_scores(self):
+        """Score changes after registration are reflected without re-registering."""
+        directory = AgentDirectory()
+        cards = {}
+        for name, score in [("demoted", 0.9), ("promoted", 0.3)]:
+            card = TrustedAgentCard(name=name, description="", capabilities=[], trust_score=score)
+            card.sign(VerificationIdentity.generate(name))
+            directory.register(card)
+            cards[name] = card
+
+        cards["demoted"].trust_score = 0.2
+        cards["promoted"].trust_score = 0.8
+        assert directory.list_trusted(0.7) == [cards["promoted"]]
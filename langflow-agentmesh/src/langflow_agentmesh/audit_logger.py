@@ -6,19 +6,102 @@ tamper-evident chain. Supports JSONL export for compliance.
 
 from __future__ import annotations
 
+import functools
 import hashlib
 import json
+import struct
+import sys
+import threading
 import time
+from collections import Counter
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from json.encoder import encode_basestring_ascii
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
 
 GENESIS_HASH = "0" * 64
 
+# Version of the encoding an entry's hash is computed over.
+# 1: sorted-key JSON of all fields (chains exported before versioning).
+# 2: length-prefixed fields streamed into the digest, see _compute_hash.
+HASH_VERSION = 2
+_LEGACY_HASH_VERSION = 1
+
+# ``slots=True`` drops the per-instance ``__dict__`` (Python 3.10+).
+_DATACLASS_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Hash input layout: big-endian float64 timestamp, then each text field
+# (and the canonical context JSON) as a uint32 byte length followed by
+# its UTF-8 bytes. Length prefixes keep the encoding unambiguous even
+# when fields contain separator characters.
+_TIMESTAMP = struct.Struct(">d")
+_LENGTH = struct.Struct(">I")
+
+# json.dumps builds a fresh JSONEncoder whenever non-default options are
+# passed; reuse configured encoders instead. The entry encoder matches
+# orjson's compact UTF-8 output so exports do not depend on the backend.
+_encode_context = json.JSONEncoder(sort_keys=True, separators=(",", ":")).encode
+_encode_entry = json.JSONEncoder(
+    sort_keys=True, separators=(",", ":"), ensure_ascii=False
+).encode
+_encode_legacy_payload = json.JSONEncoder(sort_keys=True).encode
+_ORJSON_OPTIONS = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS if orjson is not None else 0
+
+
+def _length_prefixed(value: str) -> bytes:
+    raw = value.encode("utf-8")
+    return _LENGTH.pack(len(raw)) + raw
+
+
+class _ContextTemplate:
+    """Canonical context encoder specialised for a fixed set of keys.
+
+    Produces exactly what ``_encode_context`` would, but with the sorted,
+    escaped key prefixes built once, so matching contexts skip the key
+    sort and key encoding. Contexts with any other key set fall back to
+    the generic encoder.
+    """
+
+    __slots__ = ("_keys", "_key_set", "_prefixes")
+
+    def __init__(self, keys: Iterable[str]) -> None:
+        self._keys = tuple(sorted(set(keys)))
+        self._key_set = frozenset(self._keys)
+        self._prefixes = tuple(
+            ("{" if i == 0 else ",") + encode_basestring_ascii(key) + ":"
+            for i, key in enumerate(self._keys)
+        )
+
+    def __call__(self, context: Dict[str, Any]) -> str:
+        if not self._keys or context.keys() != self._key_set:
+            return _encode_context(context)
+        parts = []
+        append = parts.append
+        for prefix, key in zip(self._prefixes, self._keys):
+            value = context[key]
+            append(prefix)
+            append(encode_basestring_ascii(value) if type(value) is str else _encode_context(value))
+        append("}")
+        return "".join(parts)
+
+
+# agent ids, actions and decisions repeat heavily, so their encoded form is
+# memoized; the bound keeps adversarial inputs from growing it forever.
+_length_prefixed_cached = functools.lru_cache(maxsize=4096)(_length_prefixed)
 
-@dataclass
+
+@dataclass(**_DATACLASS_SLOTS)
 class AuditEntry:
-    """Single audit record in the hash chain."""
+    """Single audit record in the hash chain.
+
+    ``hash_version`` names the encoding ``entry_hash`` was computed over.
+    It defaults to the legacy encoding so entries rebuilt from exports
+    that predate the field still verify.
+    """
 
     agent_id: str
     action: str
@@ -27,6 +110,7 @@ class AuditEntry:
     context: Dict[str, Any] = field(default_factory=dict)
     entry_hash: str = ""
     previous_hash: str = ""
+    hash_version: int = _LEGACY_HASH_VERSION
 
     def to_dict(self) -> Dict[str, Any]:
         """Serialize to dictionary."""
@@ -38,11 +122,14 @@ class AuditEntry:
             "context": self.context,
             "entry_hash": self.entry_hash,
             "previous_hash": self.previous_hash,
+            "hash_version": self.hash_version,
         }
 
     def to_json(self) -> str:
-        """Serialize to JSON string."""
-        return json.dumps(self.to_dict(), sort_keys=True)
+        """Serialize to JSON string, using orjson when it is installed."""
+        if orjson is not None:
+            return orjson.dumps(self.to_dict(), option=_ORJSON_OPTIONS).decode()
+        return _encode_entry(self.to_dict())
 
 
 class AuditLogger:
@@ -62,12 +149,47 @@ class AuditLogger:
     description = "Records governance decisions in a tamper-evident chain"
     icon = "file-text"
 
-    def __init__(self) -> None:
+    def __init__(self, context_schema: Optional[Iterable[str]] = None) -> None:
+        # Contexts are expected to mostly carry the keys in *context_schema*;
+        # those are encoded through a precomputed template.
+        self._encode_context = (
+            _ContextTemplate(context_schema) if context_schema else _encode_context
+        )
         self._entries: List[AuditEntry] = []
+        # Columns of the fields summary() aggregates, as they were logged
+        self._agent_ids: List[str] = []
+        self._decisions: List[str] = []
         self._last_hash: str = GENESIS_HASH
+        # Serialises appends so the chain stays linear when one logger is
+        # shared across threads.
+        self._lock = threading.Lock()
+        # Entries before this index passed the last successful verification
+        self._verified_up_to: int = 0
+        # Read-only snapshot of _entries; the chain only grows, so its
+        # length tells whether the snapshot is current
+        self._snapshot: Tuple[AuditEntry, ...] = ()
+
+    @classmethod
+    def from_entries(
+        cls,
+        entries: Iterable[AuditEntry],
+        context_schema: Optional[Iterable[str]] = None,
+    ) -> AuditLogger:
+        """Rebuild a logger from existing entries, e.g. a parsed JSONL export.
+
+        The chain is taken as given; call :meth:`verify_chain` to check it.
+        New entries are appended after the last one.
+        """
+        logger = cls(context_schema)
+        logger._entries = list(entries)
+        logger._agent_ids = [entry.agent_id for entry in logger._entries]
+        logger._decisions = [entry.decision for entry in logger._entries]
+        if logger._entries:
+            logger._last_hash = logger._entries[-1].entry_hash
+        return logger
 
     @staticmethod
-    def _compute_hash(
+    def _compute_legacy_hash(
         agent_id: str,
         action: str,
         decision: str,
@@ -75,8 +197,8 @@ class AuditLogger:
         context: Dict[str, Any],
         previous_hash: str,
     ) -> str:
-        """Compute SHA-256 hash for an entry."""
-        payload = json.dumps(
+        """Compute the version 1 hash, kept to verify older exports."""
+        payload = _encode_legacy_payload(
             {
                 "agent_id": agent_id,
                 "action": action,
@@ -84,11 +206,35 @@ class AuditLogger:
                 "timestamp": timestamp,
                 "context": context,
                 "previous_hash": previous_hash,
-            },
-            sort_keys=True,
+            }
         )
         return hashlib.sha256(payload.encode("utf-8")).hexdigest()
 
+    @staticmethod
+    def _compute_hash(
+        agent_id: str,
+        action: str,
+        decision: str,
+        timestamp: float,
+        context: Dict[str, Any],
+        previous_hash: str,
+        encode_context: Any = _encode_context,
+    ) -> str:
+        """Compute SHA-256 hash for an entry.
+
+        Fields are fed to the digest one at a time, so no combined payload
+        string is built. *encode_context* must produce the canonical
+        context JSON.
+        """
+        digest = hashlib.sha256(_TIMESTAMP.pack(timestamp))
+        update = digest.update
+        update(_length_prefixed_cached(agent_id))
+        update(_length_prefixed_cached(action))
+        update(_length_prefixed_cached(decision))
+        update(_length_prefixed(encode_context(context)))
+        update(_length_prefixed(previous_hash))
+        return digest.hexdigest()
+
     def log(
         self,
         agent_id: str,
@@ -101,67 +247,164 @@ class AuditLogger:
         ts = timestamp if timestamp is not None else time.time()
         ctx = context or {}
 
-        entry_hash = self._compute_hash(
-            agent_id=agent_id,
-            action=action,
-            decision=decision,
-            timestamp=ts,
-            context=ctx,
-            previous_hash=self._last_hash,
-        )
+        with self._lock:
+            entry_hash = self._compute_hash(
+                agent_id=agent_id,
+                action=action,
+                decision=decision,
+                timestamp=ts,
+                context=ctx,
+                previous_hash=self._last_hash,
+                encode_context=self._encode_context,
+            )
 
-        entry = AuditEntry(
-            agent_id=agent_id,
-            action=action,
-            decision=decision,
-            timestamp=ts,
-            context=ctx,
-            entry_hash=entry_hash,
-            previous_hash=self._last_hash,
-        )
+            entry = AuditEntry(
+                agent_id=agent_id,
+                action=action,
+                decision=decision,
+                timestamp=ts,
+                context=ctx,
+                entry_hash=entry_hash,
+                previous_hash=self._last_hash,
+                hash_version=HASH_VERSION,
+            )
 
-        self._entries.append(entry)
-        self._last_hash = entry_hash
+            self._entries.append(entry)
+            self._agent_ids.append(agent_id)
+            self._decisions.append(decision)
+            self._last_hash = entry_hash
         return entry
 
+    def bulk_log(
+        self,
+        records: Iterable[Tuple[str, str, str, Optional[Dict[str, Any]]]],
+        timestamp: Optional[float] = None,
+    ) -> List[AuditEntry]:
+        """Append many ``(agent_id, action, decision, context)`` records.
+
+        Chains the records exactly as repeated :meth:`log` calls would,
+        except that every entry in the batch gets the same timestamp:
+        *timestamp* if given, otherwise the clock read once for the batch.
+        Per-call lookups are hoisted out of the loop.
+        """
+        ts = timestamp if timestamp is not None else time.time()
+        compute_hash = self._compute_hash
+        encode_context = self._encode_context
+        append = self._entries.append
+        append_agent_id = self._agent_ids.append
+        append_decision = self._decisions.append
+        added: List[AuditEntry] = []
+        with self._lock:
+            previous_hash = self._last_hash
+            try:
+                for agent_id, action, decision, context in records:
+                    ctx = context or {}
+                    entry_hash = compute_hash(
+                        agent_id, action, decision, ts, ctx, previous_hash, encode_context
+                    )
+                    entry = AuditEntry(
+                        agent_id=agent_id,
+                        action=action,
+                        decision=decision,
+                        timestamp=ts,
+                        context=ctx,
+                        entry_hash=entry_hash,
+                        previous_hash=previous_hash,
+                        hash_version=HASH_VERSION,
+                    )
+                    append(entry)
+                    append_agent_id(agent_id)
+                    append_decision(decision)
+                    added.append(entry)
+                    previous_hash = entry_hash
+            finally:
+                # Keep the tip in step with whatever was appended, even if
+                # iterating *records* raised part-way through.
+                self._last_hash = previous_hash
+        return added
+
     @property
-    def entries(self) -> List[AuditEntry]:
-        """Get all audit entries."""
-        return list(self._entries)
+    def entries(self) -> Tuple[AuditEntry, ...]:
+        """Get all audit entries as a read-only snapshot.
+
+        The tuple is cached and only rebuilt after new entries are
+        appended, so repeated reads are O(1).
+        """
+        if len(self._snapshot) != len(self._entries):
+            self._snapshot = tuple(self._entries)
+        return self._snapshot
+
+    def iter_entries(self) -> Iterator[AuditEntry]:
+        """Iterate over audit entries without copying the chain."""
+        return iter(self._entries)
+
+    def __getitem__(self, index: int) -> AuditEntry:
+        """Return the entry at *index* in the chain."""
+        return self._entries[index]
 
     @property
     def chain_length(self) -> int:
         """Number of entries in the chain."""
         return len(self._entries)
 
-    def verify_chain(self) -> bool:
+    def verify_chain(self, incremental: bool = False) -> bool:
         """Verify the integrity of the entire hash chain.
 
         Returns True if all hashes are valid and properly linked.
-        """
-        if not self._entries:
-            return True
 
-        expected_prev = GENESIS_HASH
-        for entry in self._entries:
+        With ``incremental=True`` only entries appended since the last
+        successful verification are re-hashed. That is cheap for periodic
+        checks but does not re-detect in-place edits to entries that were
+        already verified; the default full pass always does.
+        """
+        entries = self._entries
+        start = self._verified_up_to if incremental else 0
+        if start > len(entries):
+            start = 0
+
+        pending = entries[start:]
+        # Linkage first: it needs no hashing, so a broken chain is rejected
+        # before any digest work. Then each entry's own hash is checked.
+        expected_prev = entries[start - 1].entry_hash if start else GENESIS_HASH
+        for entry in pending:
             if entry.previous_hash != expected_prev:
                 return False
+            expected_prev = entry.entry_hash
 
-            expected_hash = self._compute_hash(
-                agent_id=entry.agent_id,
-                action=entry.action,
-                decision=entry.decision,
-                timestamp=entry.timestamp,
-                context=entry.context,
-                previous_hash=entry.previous_hash,
-            )
+        encode_context = self._encode_context
+        for entry in pending:
+            # Each entry is checked against the encoding it was hashed with
+            if entry.hash_version == HASH_VERSION:
+                expected_hash = self._compute_hash(
+                    agent_id=entry.agent_id,
+                    action=entry.action,
+                    decision=entry.decision,
+                    timestamp=entry.timestamp,
+                    context=entry.context,
+                    previous_hash=entry.previous_hash,
+                    encode_context=encode_context,
+                )
+            elif entry.hash_version == _LEGACY_HASH_VERSION:
+                expected_hash = self._compute_legacy_hash(
+                    agent_id=entry.agent_id,
+                    action=entry.action,
+                    decision=entry.decision,
+                    timestamp=entry.timestamp,
+                    context=entry.context,
+                    previous_hash=entry.previous_hash,
+                )
+            else:
+                return False
             if entry.entry_hash != expected_hash:
                 return False
 
-            expected_prev = entry.entry_hash
-
+        self._verified_up_to = len(entries)
         return True
 
+    def invalidate_cache(self) -> None:
+        """Forget previous verification so the next incremental check is full."""
+        self._verified_up_to = 0
+
     def export_jsonl(self) -> str:
         """Export all entries as JSONL for compliance."""
         lines = [entry.to_json() for entry in self._entries]
@@ -169,24 +412,31 @@ class AuditLogger:
 
     def export_jsonl_to_file(self, path: str) -> int:
         """Export entries to a JSONL file. Returns number of entries written."""
-        content = self.export_jsonl()
-        with open(path, "w") as f:
-            f.write(content)
-            if content:
-                f.write("\n")
-        return len(self._entries)
+        # Write line by line through a large buffer rather than joining the
+        # whole export into one string first.
+        entries = self._entries
+        if orjson is not None:
+            # orjson emits UTF-8 bytes, so stay in binary mode end to end
+            dumps = orjson.dumps
+            with open(path, "wb", buffering=1 << 20) as f:
+                write = f.write
+                for entry in entries:
+                    write(dumps(entry.to_dict(), option=_ORJSON_OPTIONS))
+                    write(b"\n")
+            return len(entries)
+
+        with open(path, "w", encoding="utf-8", buffering=1 << 20) as f:
+            write = f.write
+            for entry in entries:
+                write(entry.to_json())
+                write("\n")
+        return len(entries)
 
     def summary(self) -> Dict[str, Any]:
         """Get summary statistics."""
-        decisions: Dict[str, int] = {}
-        agents: set = set()
-        for entry in self._entries:
-            decisions[entry.decision] = decisions.get(entry.decision, 0) + 1
-            agents.add(entry.agent_id)
-
         return {
             "total_entries": len(self._entries),
-            "unique_agents": len(agents),
-            "decisions": decisions,
-            "chain_valid": self.verify_chain(),
+            "unique_agents": len(set(self._agent_ids)),
+            "decisions": dict(Counter(self._decisions)),
+            "chain_valid": self.verify_chain(incremental=True),
         }
@@ -8,11 +8,16 @@ Validates agent actions against compliance frameworks:
 
 from __future__ import annotations
 
+import functools
 import json
 import re
+import sys
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+# ``slots=True`` drops the per-instance ``__dict__`` (Python 3.10+).
+_DATACLASS_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
 
 
 class ComplianceFramework(Enum):
@@ -40,9 +45,13 @@ class ComplianceStatus(Enum):
     REQUIRES_REVIEW = "requires_review"
 
 
-@dataclass
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class ComplianceViolation:
-    """A single compliance violation."""
+    """A single compliance violation.
+
+    Frozen, so violations whose text never varies can be shared between
+    results.
+    """
 
     framework: ComplianceFramework
     rule: str
@@ -61,7 +70,7 @@ class ComplianceViolation:
         }
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class ComplianceResult:
     """Result of compliance validation."""
 
@@ -76,16 +85,21 @@ class ComplianceResult:
         return {
             "compliance_status": self.compliance_status.value,
             "frameworks_checked": self.frameworks_checked,
-            "violations": [v.to_dict() for v in self.violations],
+            "violations": list(map(ComplianceViolation.to_dict, self.violations)),
             "required_actions": self.required_actions,
             "metadata": self.metadata,
         }
 
 
+# json.dumps builds a fresh JSONEncoder whenever non-default options are
+# passed; reuse a configured one instead.
+_encode_parameters = json.JSONEncoder(default=str).encode
+
+
 def _json_dumps_safe(obj: Any) -> str:
     """Safe JSON serialization for parameter scanning."""
     try:
-        return json.dumps(obj, default=str)
+        return _encode_parameters(obj)
     except (TypeError, ValueError):
         return str(obj)
 
@@ -98,6 +112,83 @@ _PHI_PATTERNS = [
     (r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b", "Email address detected"),
 ]
 
+# Literals, one of which must appear in the lowercased text for the
+# corresponding _PHI_PATTERNS entry to match. Checking them first skips
+# the regex entirely for the common PHI-free input.
+_PHI_TRIGGERS = [
+    ("-",),
+    ("mrn",),
+    ("dob", "date of"),
+    ("@",),
+]
+
+
+@functools.lru_cache(maxsize=None)
+def _compiled_phi_patterns() -> Tuple[Tuple["re.Pattern[str]", str, Tuple[str, ...]], ...]:
+    """Compiled PHI patterns with their descriptions and triggers.
+
+    Compiled on first use and shared by every ComplianceChecker.
+    """
+    return tuple(
+        (re.compile(p, re.IGNORECASE), desc, triggers)
+        for (p, desc), triggers in zip(_PHI_PATTERNS, _PHI_TRIGGERS)
+    )
+
+# Actions that need change approval under SOC2 unless the context
+# supplies its own ``sensitive_actions`` list
+_DEFAULT_SENSITIVE_ACTIONS = frozenset({"delete", "modify", "deploy", "configure"})
+
+
+@functools.lru_cache(maxsize=256)
+def _normalize_sensitive_actions(actions: tuple) -> frozenset:
+    """Lowercased set of a caller-supplied sensitive action list."""
+    return frozenset(a.lower() for a in actions)
+
+
+# Violations with fixed wording, built once and shared by every result
+_EU_TRANSPARENCY_VIOLATION = ComplianceViolation(
+    framework=ComplianceFramework.EU_AI_ACT,
+    rule="Article 13 - Transparency",
+    description="High-risk AI system requires transparency notice",
+    severity="high",
+    required_action="Add transparency notice for high-risk AI action",
+)
+_EU_OVERSIGHT_VIOLATION = ComplianceViolation(
+    framework=ComplianceFramework.EU_AI_ACT,
+    rule="Article 14 - Human Oversight",
+    description="High-risk AI system requires human oversight",
+    severity="high",
+    required_action="Enable human oversight for high-risk AI action",
+)
+_SOC2_ACCESS_VIOLATION = ComplianceViolation(
+    framework=ComplianceFramework.SOC2,
+    rule="CC6.1 - Logical Access",
+    description="Agent identity required for access control",
+    severity="high",
+    required_action="Provide agent_id for audit trail",
+)
+_SOC2_MONITORING_VIOLATION = ComplianceViolation(
+    framework=ComplianceFramework.SOC2,
+    rule="CC7.2 - System Monitoring",
+    description="Audit logging must be enabled for compliance",
+    severity="medium",
+    required_action="Enable audit logging",
+)
+_HIPAA_MINIMUM_NECESSARY_VIOLATION = ComplianceViolation(
+    framework=ComplianceFramework.HIPAA,
+    rule="§164.502(b) - Minimum Necessary",
+    description="Full data scope requested without minimum necessary justification",
+    severity="medium",
+    required_action="Justify full data scope or limit to minimum necessary",
+)
+_HIPAA_AUDIT_VIOLATION = ComplianceViolation(
+    framework=ComplianceFramework.HIPAA,
+    rule="§164.312(b) - Audit Controls",
+    description="PHI access must be logged",
+    severity="medium",
+    required_action="Enable access logging for PHI operations",
+)
+
 # High-risk AI domains per EU AI Act
 _HIGH_RISK_DOMAINS = {
     "biometric", "law_enforcement", "migration", "justice",
@@ -128,15 +219,23 @@ class ComplianceChecker:
     def __init__(
         self,
         frameworks: Optional[List[ComplianceFramework]] = None,
+        fail_fast: bool = False,
     ) -> None:
         self.frameworks: List[ComplianceFramework] = frameworks or [
             ComplianceFramework.EU_AI_ACT,
             ComplianceFramework.SOC2,
             ComplianceFramework.HIPAA,
         ]
-        self._compiled_phi = [
-            (re.compile(p, re.IGNORECASE), desc) for p, desc in _PHI_PATTERNS
-        ]
+        # Stop at the first framework reporting a critical violation; the
+        # result is NON_COMPLIANT either way, but later frameworks go unchecked
+        self.fail_fast = fail_fast
+        # Framework -> sub-check, all taking (action, parameters, agent_id, context)
+        self._dispatch = {
+            ComplianceFramework.EU_AI_ACT: self._check_eu_ai_act,
+            ComplianceFramework.SOC2: self._check_soc2,
+            ComplianceFramework.HIPAA: self._check_hipaa,
+        }
+        self._compiled_phi = _compiled_phi_patterns()
 
     def check(
         self,
@@ -150,25 +249,30 @@ class ComplianceChecker:
         ctx = context or {}
         violations: List[ComplianceViolation] = []
         required_actions: List[str] = []
+        seen_actions: Set[str] = set()
+
         frameworks_checked: List[str] = []
 
+        dispatch = self._dispatch
         for framework in self.frameworks:
             frameworks_checked.append(framework.value)
 
-            if framework == ComplianceFramework.EU_AI_ACT:
-                v, a = self._check_eu_ai_act(action, params, ctx)
-                violations.extend(v)
-                required_actions.extend(a)
-
-            elif framework == ComplianceFramework.SOC2:
-                v, a = self._check_soc2(action, params, agent_id, ctx)
-                violations.extend(v)
-                required_actions.extend(a)
-
-            elif framework == ComplianceFramework.HIPAA:
-                v, a = self._check_hipaa(action, params, ctx)
-                violations.extend(v)
-                required_actions.extend(a)
+            sub_check = dispatch.get(framework)
+            if sub_check is None:
+                continue
+            v = sub_check(action, params, agent_id, ctx)
+            if not v:
+                continue
+            violations.extend(v)
+            # Deduplicate as we go, keeping first-seen order
+            for violation in v:
+                required = violation.required_action
+                if required not in seen_actions:
+                    seen_actions.add(required)
+                    required_actions.append(required)
+
+            if self.fail_fast and any(vv.severity == "critical" for vv in v):
+                break
 
         if not violations:
             status = ComplianceStatus.COMPLIANT
@@ -181,21 +285,39 @@ class ComplianceChecker:
             compliance_status=status,
             frameworks_checked=frameworks_checked,
             violations=violations,
-            required_actions=list(dict.fromkeys(required_actions)),
+            required_actions=required_actions,
             metadata={"agent_id": agent_id, "action": action},
         )
 
+    def check_many(
+        self,
+        events: Iterable[
+            Tuple[str, Optional[Dict[str, Any]], Optional[str], Optional[Dict[str, Any]]]
+        ],
+    ) -> List[ComplianceResult]:
+        """Validate a batch of ``(action, parameters, agent_id, context)`` events.
+
+        Equivalent to calling :meth:`check` for each event; results are
+        returned in input order.
+        """
+        check = self.check
+        return [
+            check(action, parameters, agent_id, context)
+            for action, parameters, agent_id, context in events
+        ]
+
     def _check_eu_ai_act(
         self,
         action: str,
         parameters: Dict[str, Any],
+        agent_id: Optional[str],
         context: Dict[str, Any],
-    ) -> tuple:
+    ) -> List[ComplianceViolation]:
         """EU AI Act checks: transparency, risk classification, human oversight."""
+        get = context.get
         violations: List[ComplianceViolation] = []
-        actions: List[str] = []
 
-        domain = context.get("domain", "")
+        domain = get("domain", "")
         risk_level = self._classify_risk(action, domain)
 
         if risk_level == RiskLevel.UNACCEPTABLE:
@@ -206,30 +328,15 @@ class ComplianceChecker:
                 severity="critical",
                 required_action="Block action — prohibited under EU AI Act",
             ))
-            actions.append("Block action — prohibited under EU AI Act")
 
         if risk_level == RiskLevel.HIGH:
-            if not context.get("transparency_notice"):
-                violations.append(ComplianceViolation(
-                    framework=ComplianceFramework.EU_AI_ACT,
-                    rule="Article 13 - Transparency",
-                    description="High-risk AI system requires transparency notice",
-                    severity="high",
-                    required_action="Add transparency notice for high-risk AI action",
-                ))
-                actions.append("Add transparency notice for high-risk AI action")
+            if not get("transparency_notice"):
+                violations.append(_EU_TRANSPARENCY_VIOLATION)
 
-            if not context.get("human_oversight"):
-                violations.append(ComplianceViolation(
-                    framework=ComplianceFramework.EU_AI_ACT,
-                    rule="Article 14 - Human Oversight",
-                    description="High-risk AI system requires human oversight",
-                    severity="high",
-                    required_action="Enable human oversight for high-risk AI action",
-                ))
-                actions.append("Enable human oversight for high-risk AI action")
+            if not get("human_oversight"):
+                violations.append(_EU_OVERSIGHT_VIOLATION)
 
-        return violations, actions
+        return violations
 
     def _check_soc2(
         self,
@@ -237,36 +344,24 @@ class ComplianceChecker:
         parameters: Dict[str, Any],
         agent_id: Optional[str],
         context: Dict[str, Any],
-    ) -> tuple:
+    ) -> List[ComplianceViolation]:
         """SOC2 checks: access control, audit logging, change management."""
+        get = context.get
         violations: List[ComplianceViolation] = []
-        actions: List[str] = []
 
         if not agent_id:
-            violations.append(ComplianceViolation(
-                framework=ComplianceFramework.SOC2,
-                rule="CC6.1 - Logical Access",
-                description="Agent identity required for access control",
-                severity="high",
-                required_action="Provide agent_id for audit trail",
-            ))
-            actions.append("Provide agent_id for audit trail")
+            violations.append(_SOC2_ACCESS_VIOLATION)
 
-        if not context.get("audit_enabled", False):
-            violations.append(ComplianceViolation(
-                framework=ComplianceFramework.SOC2,
-                rule="CC7.2 - System Monitoring",
-                description="Audit logging must be enabled for compliance",
-                severity="medium",
-                required_action="Enable audit logging",
-            ))
-            actions.append("Enable audit logging")
+        if not get("audit_enabled", False):
+            violations.append(_SOC2_MONITORING_VIOLATION)
 
-        sensitive_actions = context.get("sensitive_actions", [
-            "delete", "modify", "deploy", "configure",
-        ])
-        if action.lower() in [a.lower() for a in sensitive_actions]:
-            if not context.get("change_approved", False):
+        sensitive_actions = get("sensitive_actions")
+        if sensitive_actions is None:
+            sensitive = _DEFAULT_SENSITIVE_ACTIONS
+        else:
+            sensitive = _normalize_sensitive_actions(tuple(sensitive_actions))
+        if action.lower() in sensitive:
+            if not get("change_approved", False):
                 violations.append(ComplianceViolation(
                     framework=ComplianceFramework.SOC2,
                     rule="CC8.1 - Change Management",
@@ -274,21 +369,22 @@ class ComplianceChecker:
                     severity="medium",
                     required_action=f"Obtain approval for sensitive action '{action}'",
                 ))
-                actions.append(f"Obtain approval for sensitive action '{action}'")
 
-        return violations, actions
+        return violations
 
     def _check_hipaa(
         self,
         action: str,
         parameters: Dict[str, Any],
+        agent_id: Optional[str],
         context: Dict[str, Any],
-    ) -> tuple:
+    ) -> List[ComplianceViolation]:
         """HIPAA checks: PHI protection, access logging, minimum necessary."""
+        get = context.get
         violations: List[ComplianceViolation] = []
-        actions: List[str] = []
 
-        all_text = f"{action} {_json_dumps_safe(parameters)}"
+        # An empty dict serializes to "{}", which no PHI pattern can match
+        all_text = f"{action} {_json_dumps_safe(parameters)}" if parameters else action
         phi_found = self._detect_phi(all_text)
         if phi_found:
             violations.append(ComplianceViolation(
@@ -298,29 +394,14 @@ class ComplianceChecker:
                 severity="critical",
                 required_action="Remove or encrypt PHI before processing",
             ))
-            actions.append("Remove or encrypt PHI before processing")
 
-        if context.get("data_scope") == "full" and not context.get("minimum_necessary_justified"):
-            violations.append(ComplianceViolation(
-                framework=ComplianceFramework.HIPAA,
-                rule="§164.502(b) - Minimum Necessary",
-                description="Full data scope requested without minimum necessary justification",
-                severity="medium",
-                required_action="Justify full data scope or limit to minimum necessary",
-            ))
-            actions.append("Justify full data scope or limit to minimum necessary")
+        if get("data_scope") == "full" and not get("minimum_necessary_justified"):
+            violations.append(_HIPAA_MINIMUM_NECESSARY_VIOLATION)
 
-        if not context.get("access_logged", False):
-            violations.append(ComplianceViolation(
-                framework=ComplianceFramework.HIPAA,
-                rule="§164.312(b) - Audit Controls",
-                description="PHI access must be logged",
-                severity="medium",
-                required_action="Enable access logging for PHI operations",
-            ))
-            actions.append("Enable access logging for PHI operations")
+        if not get("access_logged", False):
+            violations.append(_HIPAA_AUDIT_VIOLATION)
 
-        return violations, actions
+        return violations
 
     def _classify_risk(self, action: str, domain: str) -> RiskLevel:
         """Classify AI risk level per EU AI Act."""
@@ -341,8 +422,12 @@ class ComplianceChecker:
 
     def _detect_phi(self, text: str) -> List[str]:
         """Detect PHI patterns in text."""
+        lowered = text.lower()
         found: List[str] = []
-        for compiled, description in self._compiled_phi:
-            if compiled.search(text):
-                found.append(description)
+        for compiled, description, triggers in self._compiled_phi:
+            for trigger in triggers:
+                if trigger in lowered:
+                    if compiled.search(text):
+                        found.append(description)
+                    break
         return found
@@ -8,8 +8,11 @@ violation details.
 
 from __future__ import annotations
 
+import functools
+import itertools
+import sys
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from langflow_agentmesh.policy import (
     GovernanceEventType,
@@ -18,8 +21,11 @@ from langflow_agentmesh.policy import (
     PolicyCheckResult,
 )
 
+# ``slots=True`` drops the per-instance ``__dict__`` (Python 3.10+).
+_DATACLASS_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_DATACLASS_SLOTS)
 class GovernanceResult:
     """Output from the governance component."""
 
@@ -44,6 +50,22 @@ class GovernanceResult:
         return d
 
 
+@functools.lru_cache(maxsize=256)
+def _parse_blocked_patterns(patterns: tuple) -> Tuple[Tuple[str, PatternType], ...]:
+    """Normalize ``(pattern, type)`` pairs and bare substring patterns.
+
+    Cached, so components built repeatedly with the same pattern set
+    (e.g. once per flow run) skip re-parsing it.
+    """
+    parsed = []
+    for p in patterns:
+        if isinstance(p, tuple) and len(p) == 2:
+            parsed.append((p[0], PatternType(p[1])))
+        elif isinstance(p, str):
+            parsed.append((p, PatternType.SUBSTRING))
+    return tuple(parsed)
+
+
 class GovernanceComponent:
     """Langflow component for policy enforcement.
 
@@ -81,21 +103,37 @@ class GovernanceComponent:
         if policy_yaml:
             self.policy = GovernancePolicy.from_yaml(policy_yaml)
         else:
-            parsed_patterns = []
-            for p in (blocked_patterns or []):
-                if isinstance(p, (list, tuple)) and len(p) == 2:
-                    parsed_patterns.append((p[0], PatternType(p[1])))
-                elif isinstance(p, str):
-                    parsed_patterns.append((p, PatternType.SUBSTRING))
+            # Lists from the Langflow UI are turned into tuples so the
+            # pattern set can key the parse cache
+            key = tuple(
+                tuple(p) if isinstance(p, list) else p
+                for p in (blocked_patterns or [])
+                if isinstance(p, (str, list, tuple))
+            )
 
             self.policy = GovernancePolicy(
                 allowed_tools=allowed_tools or [],
                 blocked_tools=blocked_tools or [],
-                blocked_patterns=parsed_patterns,
+                blocked_patterns=list(_parse_blocked_patterns(key)),
                 max_tool_calls_per_request=max_calls,
             )
+        # next() on itertools.count is a single C call, so concurrent
+        # process() calls never hand out the same count
+        self._counter = itertools.count(1)
         self._call_count = 0
 
+    @property
+    def policy(self) -> GovernancePolicy:
+        """Policy enforced by this component."""
+        return self._policy
+
+    @policy.setter
+    def policy(self, policy: GovernancePolicy) -> None:
+        self._policy = policy
+        # Bound once here rather than looked up on every process() call
+        self._check_call_count = policy.check_call_count
+        self._enforce = policy.enforce
+
     def process(
         self,
         action: str,
@@ -108,10 +146,10 @@ class GovernanceComponent:
         allowed=False (blocked with violation details).
         """
         params = parameters or {}
-        self._call_count += 1
+        self._call_count = call_count = next(self._counter)
 
         # Check call count limit
-        count_result = self.policy.check_call_count(self._call_count)
+        count_result = self._check_call_count(call_count)
         if not count_result.allowed:
             return GovernanceResult(
                 allowed=False,
@@ -123,7 +161,7 @@ class GovernanceComponent:
             )
 
         # Run full policy enforcement
-        result = self.policy.enforce(action, params, agent_id=agent_id)
+        result = self._enforce(action, params, agent_id=agent_id)
 
         return GovernanceResult(
             allowed=result.allowed,
@@ -136,6 +174,7 @@ class GovernanceComponent:
 
     def reset(self) -> None:
         """Reset call counter for a new session."""
+        self._counter = itertools.count(1)
         self._call_count = 0
 
     @property
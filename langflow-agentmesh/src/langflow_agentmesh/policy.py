@@ -10,7 +10,7 @@ import fnmatch
 import re
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
 
 
 class PatternType(Enum):
@@ -49,6 +49,10 @@ class GovernancePolicy:
 
     Defines execution limits, blocked/allowed tools, content patterns,
     and argument scanning rules. Serializable to/from YAML.
+
+    Tool lists and patterns are indexed when assigned. After editing
+    ``allowed_tools``, ``blocked_tools`` or ``blocked_patterns`` in place,
+    reassign the list or call :meth:`refresh`.
     """
 
     allowed_tools: List[str] = field(default_factory=list)
@@ -64,29 +68,62 @@ class GovernancePolicy:
     _compiled_patterns: Optional[List[Tuple[str, PatternType, "re.Pattern[str]"]]] = field(
         default=None, repr=False, compare=False
     )
+    # Lowercased literal per compiled pattern, or None where the regex must run
+    _pattern_literals: Optional[List[Optional[str]]] = field(
+        default=None, repr=False, compare=False
+    )
 
     def __post_init__(self) -> None:
         self._compile_patterns()
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        # Frozenset views of the tool lists, rebuilt whenever a list is
+        # assigned (including by __init__) so check_tool is O(1)
+        if name == "blocked_tools":
+            self._blocked_tool_set: FrozenSet[str] = frozenset(value)
+        elif name == "allowed_tools":
+            self._allowed_tool_set: FrozenSet[str] = frozenset(value)
+
+    def refresh(self) -> None:
+        """Re-index tool lists and patterns after editing them in place."""
+        self.blocked_tools = self.blocked_tools
+        self.allowed_tools = self.allowed_tools
+        self._compile_patterns()
+
     def _compile_patterns(self) -> None:
         """Pre-compile regex and glob patterns for performance."""
         self._compiled_patterns = []
+        self._pattern_literals = []
         for pattern, ptype in self.blocked_patterns:
+            literal = None
             if ptype == PatternType.REGEX:
                 compiled = re.compile(pattern, re.IGNORECASE)
             elif ptype == PatternType.GLOB:
                 compiled = re.compile(fnmatch.translate(pattern), re.IGNORECASE)
             else:
                 compiled = re.compile(re.escape(pattern), re.IGNORECASE)
+                # For ASCII text and an ASCII pattern, a case-insensitive
+                # literal search is a plain substring test on lowercased text
+                if pattern.isascii():
+                    literal = pattern.lower()
             self._compiled_patterns.append((pattern, ptype, compiled))
+            self._pattern_literals.append(literal)
 
     def check_content(self, text: str) -> PolicyCheckResult:
         """Check text against blocked patterns."""
         if not self._compiled_patterns:
             self._compile_patterns()
 
-        for pattern, ptype, compiled in self._compiled_patterns:  # type: ignore[union-attr]
-            if compiled.search(text):
+        lowered = text.lower() if text.isascii() else None
+        for (pattern, ptype, compiled), literal in zip(
+            self._compiled_patterns, self._pattern_literals  # type: ignore[arg-type]
+        ):
+            if literal is not None and lowered is not None:
+                matched = literal in lowered
+            else:
+                matched = compiled.search(text) is not None
+            if matched:
                 return PolicyCheckResult(
                     allowed=False,
                     reason=f"Blocked pattern matched: '{pattern}' ({ptype.value})",
@@ -97,26 +134,32 @@ class GovernancePolicy:
 
     def check_tool(self, tool_name: str) -> PolicyCheckResult:
         """Check if a tool is allowed by policy."""
-        if tool_name in self.blocked_tools:
+        if tool_name in self._blocked_tool_set:
             return PolicyCheckResult(
                 allowed=False,
                 reason=f"Tool '{tool_name}' is in blocklist",
                 event_type=GovernanceEventType.TOOL_CALL_BLOCKED,
                 metadata={"tool_name": tool_name, "blocked_tools": self.blocked_tools},
             )
-        if self.allowed_tools and tool_name not in self.allowed_tools:
-            return PolicyCheckResult(
-                allowed=False,
-                reason=f"Tool '{tool_name}' not in allowed list: {self.allowed_tools}",
-                event_type=GovernanceEventType.TOOL_CALL_BLOCKED,
-                metadata={"tool_name": tool_name, "allowed_tools": self.allowed_tools},
-            )
+        if self.allowed_tools:
+            if tool_name not in self._allowed_tool_set:
+                return PolicyCheckResult(
+                    allowed=False,
+                    reason=f"Tool '{tool_name}' not in allowed list: {self.allowed_tools}",
+                    event_type=GovernanceEventType.TOOL_CALL_BLOCKED,
+                    metadata={"tool_name": tool_name, "allowed_tools": self.allowed_tools},
+                )
         return PolicyCheckResult(allowed=True)
 
     def check_arguments(self, arguments: Dict[str, Any]) -> PolicyCheckResult:
         """Scan tool arguments for blocked content patterns."""
-        for key, value in arguments.items():
-            text = str(value)
+        return self._check_argument_texts(arguments, [str(v) for v in arguments.values()])
+
+    def _check_argument_texts(
+        self, arguments: Dict[str, Any], texts: List[str]
+    ) -> PolicyCheckResult:
+        """Scan already-stringified argument values, in argument order."""
+        for key, text in zip(arguments, texts):
             result = self.check_content(text)
             if not result.allowed:
                 result.metadata["argument_key"] = key
@@ -149,16 +192,21 @@ class GovernancePolicy:
             tool_result.metadata["agent_id"] = agent_id
             return tool_result
 
-        arg_result = self.check_arguments(parameters)
-        if not arg_result.allowed:
-            arg_result.metadata["agent_id"] = agent_id
-            return arg_result
-
-        content = f"{action} {' '.join(str(v) for v in parameters.values())}"
-        content_result = self.check_content(content)
-        if not content_result.allowed:
-            content_result.metadata["agent_id"] = agent_id
-            return content_result
+        if self.blocked_patterns:
+            # Values are stringified once and shared by the per-argument scan
+            # and the combined scan, which also covers the action and
+            # matches spanning adjacent values
+            texts = [str(v) for v in parameters.values()]
+            arg_result = self._check_argument_texts(parameters, texts)
+            if not arg_result.allowed:
+                arg_result.metadata["agent_id"] = agent_id
+                return arg_result
+
+            content = f"{action} {' '.join(texts)}"
+            content_result = self.check_content(content)
+            if not content_result.allowed:
+                content_result.metadata["agent_id"] = agent_id
+                return content_result
 
         return PolicyCheckResult(
             allowed=True,
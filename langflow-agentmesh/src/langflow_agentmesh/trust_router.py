@@ -10,7 +10,7 @@ from __future__ import annotations
 import time
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, ClassVar, Dict, List, Optional, Tuple
 
 
 class RouteDecision(Enum):
@@ -33,22 +33,18 @@ class TrustScore:
     history: float = 0.5
     last_updated: float = field(default_factory=time.time)
 
-    _WEIGHTS: Dict[str, float] = field(
-        default_factory=lambda: {
-            "reliability": 0.25,
-            "capability": 0.20,
-            "security": 0.25,
-            "compliance": 0.20,
-            "history": 0.10,
-        },
-        repr=False,
+    # Dimension weights for compute_overall, shared by all scores
+    _WEIGHTS: ClassVar[Tuple[Tuple[str, float], ...]] = (
+        ("reliability", 0.25),
+        ("capability", 0.20),
+        ("security", 0.25),
+        ("compliance", 0.20),
+        ("history", 0.10),
     )
 
     def compute_overall(self) -> float:
         """Compute weighted overall score from dimensions."""
-        total = 0.0
-        for dim, weight in self._WEIGHTS.items():
-            total += getattr(self, dim) * weight
+        total = sum(getattr(self, dim) * weight for dim, weight in self._WEIGHTS)
         self.overall = round(min(max(total, 0.0), 1.0), 4)
         self.last_updated = time.time()
         return self.overall
@@ -65,6 +61,10 @@ class TrustScore:
         }
 
 
+# Score dimensions that record_success/record_failure/apply_decay adjust
+_DIMENSIONS = frozenset(dim for dim, _ in TrustScore._WEIGHTS)
+
+
 @dataclass
 class RouteResult:
     """Result of trust-based routing."""
@@ -162,7 +162,7 @@ class TrustRouter:
         score = self.get_score(agent_id)
         dims = dimensions or ["reliability"]
         for dim in dims:
-            if hasattr(score, dim) and dim not in ("overall", "last_updated", "_WEIGHTS"):
+            if dim in _DIMENSIONS:
                 current = getattr(score, dim)
                 new_val = min(current + self.reward_rate, 1.0)
                 setattr(score, dim, round(new_val, 4))
@@ -178,7 +178,7 @@ class TrustRouter:
         score = self.get_score(agent_id)
         dims = dimensions or ["reliability"]
         for dim in dims:
-            if hasattr(score, dim) and dim not in ("overall", "last_updated", "_WEIGHTS"):
+            if dim in _DIMENSIONS:
                 current = getattr(score, dim)
                 new_val = max(current - self.penalty_rate, 0.0)
                 setattr(score, dim, round(new_val, 4))
@@ -189,7 +189,7 @@ class TrustRouter:
         """Apply time-based decay to trust scores."""
         score = self.get_score(agent_id)
         decay = self.decay_rate * hours_elapsed
-        for dim in ["reliability", "capability", "security", "compliance", "history"]:
+        for dim, _ in TrustScore._WEIGHTS:
             current = getattr(score, dim)
             new_val = max(current - decay, 0.0)
             setattr(score, dim, round(new_val, 4))
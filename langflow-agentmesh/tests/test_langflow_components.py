@@ -5,9 +5,12 @@ audit logger, and compliance checker. No Langflow dependency
 required — tests the governance engine directly.
 """
 
+import hashlib
 import json
 import tempfile
 import os
+import sys
+import threading
 
 import pytest
 
@@ -31,6 +34,7 @@ from langflow_agentmesh.audit_logger import (
     AuditLogger,
     AuditEntry,
     GENESIS_HASH,
+    HASH_VERSION,
 )
 from langflow_agentmesh.compliance_checker import (
     ComplianceChecker,
@@ -64,6 +68,18 @@ class TestGovernancePolicy:
         assert result.allowed is False
         assert "rm -rf" in result.reason
 
+    def test_check_content_substring_case_and_unicode(self):
+        policy = GovernancePolicy(
+            blocked_patterns=[
+                ("DROP TABLE", PatternType.SUBSTRING),
+                ("sudo", PatternType.SUBSTRING),
+            ]
+        )
+        assert policy.check_content("please drop table users").metadata["pattern"] == "DROP TABLE"
+        # Non-ASCII text keeps the regex's Unicode case folding (long s)
+        assert policy.check_content("run \u017fudo now").allowed is False
+        assert policy.check_content("nothing to see").allowed is True
+
     def test_check_content_regex_match(self):
         policy = GovernancePolicy(
             blocked_patterns=[(r"password\s*=\s*\w+", PatternType.REGEX)]
@@ -88,6 +104,38 @@ class TestGovernancePolicy:
         assert policy.check_tool("search").allowed is True
         assert policy.check_tool("delete").allowed is False
 
+    def test_check_tool_sees_reassigned_lists(self):
+        policy = GovernancePolicy(blocked_tools=["delete"], allowed_tools=["search"])
+        assert "not in allowed list" in policy.check_tool("drop").reason
+        policy.allowed_tools = ["search", "drop"]
+        assert policy.check_tool("drop").allowed is True
+        policy.blocked_tools = ["drop"]
+        assert "blocklist" in policy.check_tool("drop").reason
+        policy.blocked_tools = []
+        policy.allowed_tools = []
+        assert policy.check_tool("anything").allowed is True
+
+    def test_refresh_picks_up_in_place_edits(self):
+        policy = GovernancePolicy(blocked_tools=["delete"], allowed_tools=["shell", "search"])
+        assert policy.check_tool("shell").allowed is True
+        policy.blocked_tools[0] = "shell"
+        policy.refresh()
+        assert "blocklist" in policy.check_tool("shell").reason
+        policy.blocked_tools[0] = "delete"
+        policy.allowed_tools.remove("shell")
+        policy.allowed_tools.append("read")
+        policy.refresh()
+        assert "not in allowed list" in policy.check_tool("shell").reason
+
+    def test_enforce_scans_action_and_joined_values(self):
+        policy = GovernancePolicy(blocked_patterns=[("rm -rf", PatternType.SUBSTRING)])
+        result = policy.enforce("shell", {"cmd": "rm", "flags": "-rf /"}, agent_id="a1")
+        assert result.allowed is False
+        assert "argument_key" not in result.metadata
+        result = policy.enforce("shell", {"cmd": "echo", "arg": "rm -rf"}, agent_id="a1")
+        assert result.metadata["argument_key"] == "arg"
+        assert result.metadata["agent_id"] == "a1"
+
     def test_check_tool_blocklist_overrides_allowlist(self):
         policy = GovernancePolicy(
             allowed_tools=["search", "delete"],
@@ -171,6 +219,18 @@ class TestGovernanceComponent:
         result = comp.process("execute", {"cmd": "rm -rf /"}, agent_id="a1")
         assert result.allowed is False
 
+    def test_blocked_patterns_accept_lists_and_strings(self):
+        patterns = [["DROP\\s+TABLE", "regex"], "secret"]
+        first = GovernanceComponent(blocked_patterns=patterns)
+        second = GovernanceComponent(blocked_patterns=patterns)
+        assert first.policy.blocked_patterns == [
+            ("DROP\\s+TABLE", PatternType.REGEX),
+            ("secret", PatternType.SUBSTRING),
+        ]
+        assert first.policy.blocked_patterns is not second.policy.blocked_patterns
+        assert first.process("sql", {"q": "drop  table users"}).allowed is False
+        assert second.process("read", {"q": "the secret"}).allowed is False
+
     def test_call_count_limit(self):
         comp = GovernanceComponent(max_calls=2)
         assert comp.process("a", {}).allowed is True
@@ -184,6 +244,26 @@ class TestGovernanceComponent:
         comp.reset()
         assert comp.process("c", {}).allowed is True
 
+    def test_replacing_policy_takes_effect(self):
+        comp = GovernanceComponent()
+        comp.policy = GovernancePolicy(blocked_tools=["search"], max_tool_calls_per_request=1)
+        assert "blocklist" in comp.process("search", {}).violation_reason
+        assert "limit" in comp.process("read", {}).violation_reason
+
+    def test_concurrent_process_counts_every_call(self):
+        comp = GovernanceComponent(max_calls=10_000)
+
+        def worker():
+            for _ in range(500):
+                comp.process("search", {})
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert next(comp._counter) == 4001
+
     def test_policy_yaml_init(self):
         yaml_str = """
 max_tool_calls_per_request: 5
@@ -211,6 +291,21 @@ blocked_patterns:
 
 
 class TestTrustRouter:
+    def test_overall_uses_dimension_weights(self):
+        score = TrustScore(
+            reliability=0.9, capability=0.3, security=0.7, compliance=0.1, history=0.6
+        )
+        # 0.9*0.25 + 0.3*0.20 + 0.7*0.25 + 0.1*0.20 + 0.6*0.10
+        assert score.compute_overall() == 0.54
+        assert sum(weight for _, weight in TrustScore._WEIGHTS) == pytest.approx(1.0)
+        assert "_WEIGHTS" not in score.to_dict()
+
+    def test_record_ignores_unknown_dimensions(self):
+        router = TrustRouter()
+        score = router.record_success("a1", dimensions=["overall", "compute_overall", "security"])
+        assert score.security == 0.55
+        assert callable(score.compute_overall)
+
     def test_default_routes_to_review(self):
         router = TrustRouter()
         result = router.route("agent-1", payload="data")
@@ -327,6 +422,114 @@ class TestAuditLogger:
         logger._entries[0].action = "tampered"
         assert logger.verify_chain() is False
 
+    def test_field_boundaries_are_unambiguous(self):
+        h1 = AuditLogger._compute_hash("a|b", "c", "allowed", 1000.0, {}, GENESIS_HASH)
+        h2 = AuditLogger._compute_hash("a", "b|c", "allowed", 1000.0, {}, GENESIS_HASH)
+        assert h1 != h2
+
+    def test_verify_chain_rejects_broken_link_before_hashing(self, monkeypatch):
+        logger = AuditLogger()
+        logger.log("a1", "search", "allowed", timestamp=1000.0)
+        logger.log("a1", "read", "allowed", timestamp=1001.0)
+        logger._entries[1].previous_hash = GENESIS_HASH
+
+        def fail(*args, **kwargs):
+            raise AssertionError("hashed despite broken linkage")
+
+        monkeypatch.setattr(logger, "_compute_hash", fail)
+        assert logger.verify_chain() is False
+
+    def test_context_schema_matches_generic_hashes(self):
+        contexts = [
+            {"user": "alice", "route": "/x", "reason": "ok"},
+            {"user": "b\u00e9\"b", "route": None, "reason": {"z": 1, "a": [1.5, True]}},
+            {"user": "carol"},
+            {},
+        ]
+        plain = AuditLogger()
+        templated = AuditLogger(context_schema=["user", "route", "reason"])
+        for i, ctx in enumerate(contexts):
+            plain.log("a1", "search", "allowed", context=ctx, timestamp=1000.0 + i)
+            templated.log("a1", "search", "allowed", context=ctx, timestamp=1000.0 + i)
+        assert [e.entry_hash for e in templated.entries] == [e.entry_hash for e in plain.entries]
+        assert templated.verify_chain() is True
+
+    def test_verify_chain_detects_context_tampering(self):
+        logger = AuditLogger()
+        logger.log("a1", "search", "allowed", context={"q": "x"}, timestamp=1000.0)
+        logger._entries[0].context["q"] = "y"
+        assert logger.verify_chain() is False
+
+    def test_incremental_verify_only_checks_new_entries(self):
+        logger = AuditLogger()
+        logger.log("a1", "search", "allowed", timestamp=1000.0)
+        assert logger.verify_chain() is True
+        logger._entries[0].action = "tampered"
+        logger.log("a1", "read", "allowed", timestamp=1001.0)
+        # Already-verified entries are skipped by the incremental pass...
+        assert logger.verify_chain(incremental=True) is True
+        # ...but a full pass, or one after invalidate_cache, catches the edit
+        assert logger.verify_chain() is False
+        logger.invalidate_cache()
+        assert logger.verify_chain(incremental=True) is False
+
+    def test_incremental_verify_detects_bad_new_entry(self):
+        logger = AuditLogger()
+        logger.log("a1", "search", "allowed", timestamp=1000.0)
+        assert logger.summary()["chain_valid"] is True
+        entry = logger.log("a1", "read", "allowed", timestamp=1001.0)
+        entry.decision = "blocked"
+        assert logger.summary()["chain_valid"] is False
+
+    def test_bulk_log_matches_log(self):
+        records = [
+            ("a1", "search", "allowed", {"q": "x"}),
+            ("a2", "read", "blocked", None),
+        ]
+        bulk = AuditLogger()
+        added = bulk.bulk_log(records, timestamp=1000.0)
+        single = AuditLogger()
+        for agent_id, action, decision, context in records:
+            single.log(agent_id, action, decision, context=context, timestamp=1000.0)
+
+        assert [e.entry_hash for e in added] == [e.entry_hash for e in single.entries]
+        assert bulk.verify_chain() is True
+        follow = bulk.log("a1", "write", "allowed", timestamp=1001.0)
+        assert follow.previous_hash == added[-1].entry_hash
+
+    def test_bulk_log_shares_one_timestamp(self):
+        logger = AuditLogger()
+        added = logger.bulk_log([("a1", "search", "allowed", None)] * 3)
+        assert len({e.timestamp for e in added}) == 1
+        assert logger.verify_chain() is True
+
+    def test_entries_snapshot_and_views(self):
+        logger = AuditLogger()
+        e1 = logger.log("a1", "search", "allowed", timestamp=1000.0)
+        snapshot = logger.entries
+        assert snapshot == (e1,)
+        assert logger.entries is snapshot
+        e2 = logger.log("a1", "read", "allowed", timestamp=1001.0)
+        assert logger.entries == (e1, e2)
+        assert list(logger.iter_entries()) == [e1, e2]
+        assert logger[0] is e1
+        assert logger[-1] is e2
+
+    def test_concurrent_logging_keeps_chain_valid(self):
+        logger = AuditLogger()
+
+        def worker(n):
+            for i in range(50):
+                logger.log(f"agent-{n}", f"action-{i}", "allowed")
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert logger.chain_length == 200
+        assert logger.verify_chain() is True
+
     def test_export_jsonl(self):
         logger = AuditLogger()
         logger.log("a1", "search", "allowed", timestamp=1000.0)
@@ -353,6 +556,21 @@ class TestAuditLogger:
         finally:
             os.unlink(path)
 
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_export_jsonl_to_file_matches_export_jsonl(self, tmp_path, monkeypatch, use_orjson):
+        if not use_orjson:
+            monkeypatch.setattr("langflow_agentmesh.audit_logger.orjson", None)
+        logger = AuditLogger()
+        logger.log("a1", "search", "allowed", timestamp=1000.0)
+        logger.log("a2", "read", "blocked", timestamp=1001.0)
+        path = tmp_path / "audit.jsonl"
+        assert logger.export_jsonl_to_file(str(path)) == 2
+        assert path.read_text() == logger.export_jsonl() + "\n"
+
+        empty = tmp_path / "empty.jsonl"
+        assert AuditLogger().export_jsonl_to_file(str(empty)) == 0
+        assert empty.read_text() == ""
+
     def test_summary(self):
         logger = AuditLogger()
         logger.log("a1", "search", "allowed", timestamp=1000.0)
@@ -365,6 +583,81 @@ class TestAuditLogger:
         assert summary["decisions"]["blocked"] == 1
         assert summary["chain_valid"] is True
 
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need 3.10+")
+    def test_entry_has_no_instance_dict(self):
+        entry = AuditLogger().log("a1", "search", "allowed", timestamp=1000.0)
+        assert not hasattr(entry, "__dict__")
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_entry_to_json_round_trips(self, monkeypatch, use_orjson):
+        if not use_orjson:
+            monkeypatch.setattr("langflow_agentmesh.audit_logger.orjson", None)
+        entry = AuditLogger().log(
+            "a1", "search", "allowed", context={"b": 1, "a": "é"}, timestamp=1000.5
+        )
+        assert json.loads(entry.to_json()) == entry.to_dict()
+
+    def test_json_output_does_not_depend_on_orjson(self, tmp_path, monkeypatch):
+        pytest.importorskip("orjson")
+        logger = AuditLogger()
+        logger.log(
+            "a1", "search", "allowed",
+            context={"b": [1, None, True], "a": "caf\u00e9 \u2603", "n": {"x": 2.5}},
+            timestamp=1000.5,
+        )
+        logger.log("a2", "read", "blocked", timestamp=1001.0)
+        with_orjson = logger.export_jsonl()
+        logger.export_jsonl_to_file(str(tmp_path / "orjson.jsonl"))
+
+        monkeypatch.setattr("langflow_agentmesh.audit_logger.orjson", None)
+        assert logger.export_jsonl() == with_orjson
+        assert "\u2603" in with_orjson and '":"' in with_orjson
+        logger.export_jsonl_to_file(str(tmp_path / "json.jsonl"))
+        assert (tmp_path / "json.jsonl").read_bytes() == (tmp_path / "orjson.jsonl").read_bytes()
+
+    def test_exported_chain_verifies_after_reload(self):
+        logger = AuditLogger()
+        logger.log("a1", "search", "allowed", context={"q": "x"}, timestamp=1000.0)
+        logger.log("a2", "read", "blocked", timestamp=1001.0)
+        records = [json.loads(line) for line in logger.export_jsonl().splitlines()]
+        assert all(r["hash_version"] == HASH_VERSION for r in records)
+        restored = AuditLogger.from_entries(AuditEntry(**r) for r in records)
+        assert restored.verify_chain() is True
+        assert restored.summary()["unique_agents"] == 2
+
+    def test_legacy_export_still_verifies(self):
+        records = []
+        previous_hash = GENESIS_HASH
+        for i, (agent_id, decision) in enumerate([("a1", "allowed"), ("a2", "blocked")]):
+            record = {
+                "agent_id": agent_id,
+                "action": "search",
+                "decision": decision,
+                "timestamp": 1000.0 + i,
+                "context": {"q": "caf\u00e9"},
+                "previous_hash": previous_hash,
+            }
+            payload = json.dumps(record, sort_keys=True)
+            previous_hash = record["entry_hash"] = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+            records.append(record)
+
+        restored = AuditLogger.from_entries(AuditEntry(**r) for r in records)
+        assert restored.verify_chain() is True
+        # New entries continue the chain in the current encoding
+        entry = restored.log("a3", "write", "allowed", timestamp=1002.0)
+        assert entry.previous_hash == records[-1]["entry_hash"]
+        assert entry.hash_version == HASH_VERSION
+        assert restored.verify_chain() is True
+
+        restored[0].decision = "blocked"
+        assert restored.verify_chain() is False
+
+    def test_unknown_hash_version_fails_verification(self):
+        logger = AuditLogger()
+        entry = logger.log("a1", "search", "allowed", timestamp=1000.0)
+        entry.hash_version = 99
+        assert logger.verify_chain() is False
+
     def test_entry_to_dict(self):
         logger = AuditLogger()
         entry = logger.log("a1", "search", "allowed", timestamp=1000.0)
@@ -424,6 +717,26 @@ class TestComplianceChecker:
         )
         assert result.compliance_status == ComplianceStatus.COMPLIANT
 
+    def test_fail_fast_stops_after_critical_violation(self):
+        checker = ComplianceChecker(fail_fast=True)
+        result = checker.check("social_scoring", {"ssn": "123-45-6789"}, agent_id="a1")
+        assert result.compliance_status == ComplianceStatus.NON_COMPLIANT
+        assert result.frameworks_checked == ["eu_ai_act"]
+
+        full = ComplianceChecker().check("social_scoring", {"ssn": "123-45-6789"}, agent_id="a1")
+        assert full.frameworks_checked == ["eu_ai_act", "soc2", "hipaa"]
+        assert any("PHI" in v.rule for v in full.violations)
+
+    def test_check_many_matches_check(self):
+        checker = ComplianceChecker()
+        events = [
+            ("search", {"query": "hello"}, "a1", {"audit_enabled": True, "access_logged": True}),
+            ("social_scoring", None, None, None),
+            ("query", {"data": "SSN: 123-45-6789"}, "a2", {"access_logged": True}),
+        ]
+        results = checker.check_many(events)
+        assert [r.to_dict() for r in results] == [checker.check(*e).to_dict() for e in events]
+
     def test_soc2_missing_agent_id(self):
         checker = ComplianceChecker(frameworks=[ComplianceFramework.SOC2])
         result = checker.check(
@@ -448,6 +761,14 @@ class TestComplianceChecker:
         )
         assert any("CC8.1" in v.rule for v in result.violations)
 
+    def test_soc2_custom_sensitive_actions(self):
+        checker = ComplianceChecker(frameworks=[ComplianceFramework.SOC2])
+        ctx = {"audit_enabled": True, "sensitive_actions": ["Export"]}
+        result = checker.check("EXPORT", {}, agent_id="a1", context=ctx)
+        assert any("CC8.1" in v.rule for v in result.violations)
+        result = checker.check("delete", {}, agent_id="a1", context=ctx)
+        assert not any("CC8.1" in v.rule for v in result.violations)
+
     def test_hipaa_phi_ssn_detected(self):
         checker = ComplianceChecker(frameworks=[ComplianceFramework.HIPAA])
         result = checker.check(
@@ -465,6 +786,26 @@ class TestComplianceChecker:
         )
         assert result.compliance_status == ComplianceStatus.NON_COMPLIANT
 
+    @pytest.mark.parametrize("text, expected", [
+        ("ssn 123-45-6789", "SSN detected"),
+        ("Mrn #42", "Medical Record Number detected"),
+        ("Date of Birth: 01/02/1990", "Date of Birth detected"),
+        ("dob 1-2-90", "Date of Birth detected"),
+        ("mail Jane.Doe@Example.org", "Email address detected"),
+    ])
+    def test_detect_phi_each_pattern(self, text, expected):
+        assert ComplianceChecker()._detect_phi(text) == [expected]
+
+    def test_compiled_phi_shared_between_checkers(self):
+        assert ComplianceChecker()._compiled_phi is ComplianceChecker()._compiled_phi
+
+    def test_detect_phi_skips_regex_without_trigger(self):
+        checker = ComplianceChecker()
+        checker._compiled_phi = [
+            (None, desc, triggers) for _, desc, triggers in checker._compiled_phi
+        ]
+        assert checker._detect_phi("query {\"q\": \"weather in paris\"}") == []
+
     def test_hipaa_minimum_necessary(self):
         checker = ComplianceChecker(frameworks=[ComplianceFramework.HIPAA])
         result = checker.check(
@@ -486,6 +827,16 @@ class TestComplianceChecker:
         result = checker.check("search", {}, agent_id="a1")
         assert result.frameworks_checked == ["eu_ai_act"]
 
+    def test_frameworks_checked_follows_reassigned_frameworks(self):
+        checker = ComplianceChecker(frameworks=[ComplianceFramework.SOC2])
+        first = checker.check("search", {}, agent_id="a1")
+        first.frameworks_checked.append("tampered")
+        assert checker.check("search", {}, agent_id="a1").frameworks_checked == ["soc2"]
+        checker.frameworks = [ComplianceFramework.HIPAA, ComplianceFramework.SOC2]
+        assert checker.check("search", {}, agent_id="a1").frameworks_checked == ["hipaa", "soc2"]
+        checker.frameworks[0] = ComplianceFramework.EU_AI_ACT
+        assert checker.check("search", {}, agent_id="a1").frameworks_checked == ["eu_ai_act", "soc2"]
+
     def test_result_to_dict(self):
         checker = ComplianceChecker()
         result = checker.check(
@@ -498,6 +849,31 @@ class TestComplianceChecker:
         assert "violations" in d
         assert "required_actions" in d
 
+    def test_required_actions_deduplicated_in_order(self):
+        checker = ComplianceChecker(frameworks=[ComplianceFramework.SOC2] * 2)
+        result = checker.check("search", {}, agent_id=None)
+        assert result.required_actions == [
+            "Provide agent_id for audit trail",
+            "Enable audit logging",
+        ]
+        assert len(result.violations) == 4
+
+    def test_static_violations_are_shared_and_frozen(self):
+        checker = ComplianceChecker(frameworks=[ComplianceFramework.SOC2])
+        first = checker.check("search", {}, agent_id=None).violations[0]
+        second = checker.check("search", {}, agent_id=None).violations[0]
+        assert first is second
+        with pytest.raises(AttributeError):
+            first.severity = "low"
+
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need 3.10+")
+    def test_result_types_are_slotted(self):
+        result = ComplianceChecker(frameworks=[ComplianceFramework.SOC2]).check("search", {})
+        assert not hasattr(result, "__dict__")
+        assert not hasattr(result.violations[0], "__dict__")
+        assert not hasattr(GovernanceComponent().process("search"), "__dict__")
+        assert len(set(result.violations)) == len(result.violations)
+
     def test_violation_to_dict(self):
         checker = ComplianceChecker(frameworks=[ComplianceFramework.SOC2])
         result = checker.check("search", {}, agent_id=None)